@@ -1,24 +1,111 @@
+import numpy as np
 import pandas as pd
 import json
-import glob
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional; cai para o json da stdlib
+    orjson = None
+
+# Ambos aceitam bytes: os arquivos são lidos em modo binário (sem decodificar duas vezes)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Campos do lote (lots.jsonl) -> colunas do relatório
+_LOT_COLUMNS = {
+    'lot_id': 'id',
+    'description_short': 'descricao',
+    'brand_model': 'modelo',
+    'year': 'ano',
+    'situation': 'situacao',
+    'start_bid': 'lance_inicial',
+    'auction_id': 'leilao_id',
+    'lot_url': 'link',
+}
+
+_CURRENCY_STRIP = re.compile(r'[^\d,]')
+# ...-lotes-2842-2026 -> 2842
+_RX_AUCTION_TAIL = re.compile(r'-(\d+)-\d{4}$')
+_RX_NOME_LOTE = re.compile(r'(Lote\s*\d+[a-zA-Z]?)', re.IGNORECASE)
+_RX_LOTE_NUM = re.compile(r'(\d+)')
+
+def clean_currency(values):
+    """Converte a coluna de lances (números ou textos "R$ 1.234,56") para float.
+
+    Textos são limpos de forma vetorizada com o acessor .str; textos vazios
+    ou inválidos (e None) viram 0.0. Números passam direto, inclusive NaN
+    (lance ausente), que segue vazio na exportação. As máscaras de tipo
+    saem do próprio pandas/NumPy, sem callback Python por linha.
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype('float64')
 
-def clean_currency(value):
-    if isinstance(value, (int, float)):
-        return value
-    if not value:
-        return 0.0
-    # Remove R$, dots and replace comma with dot
-    clean = re.sub(r'[^\d,]', '', str(value))
-    clean = clean.replace(',', '.')
     try:
-        return float(clean)
-    except ValueError:
-        return 0.0
+        # .str devolve NaN para o que não é texto
+        is_text = values.str.len().notna()
+    except AttributeError:  # coluna sem nenhum texto: o acessor .str recusa
+        is_text = pd.Series(False, index=values.index)
+    # Remove R$, pontos e espaços; vírgula decimal vira ponto
+    texts = (
+        values[is_text].astype('string')
+        .str.replace(_CURRENCY_STRIP, '', regex=True)
+        .str.replace(',', '.', regex=False)
+    )
+    parsed = pd.to_numeric(texts, errors='coerce').fillna(0.0)
+    # None (ausente no JSON) vira 0.0; NaN numérico não é None e segue NaN
+    is_none = values.isna() & np.equal(values.to_numpy(dtype=object), None)
+    numbers = pd.to_numeric(values.where(~is_text), errors='coerce')
+    return numbers.mask(is_text, parsed).mask(is_none, 0.0).astype('float64')
+
+def _parse_jsonl_file(fpath, seen=None):
+    """Lê um lots.jsonl e devolve as colunas do relatório (dict de listas).
+
+    Só os campos usados no relatório são projetados; campos volumosos
+    (raw_text, image_urls, ...) são descartados já na leitura. Lotes cujo
+    lot_id já está em `seen` são pulados (o mesmo lote coletado em testes
+    diferentes). Função de topo de módulo para poder rodar num
+    ProcessPoolExecutor.
+    """
+    if seen is None:
+        seen = set()
+    columns = {col: [] for col in _LOT_COLUMNS.values()}
+    targets = [(k, columns[col].append) for k, col in _LOT_COLUMNS.items()]
+    # Shards pequenos: um único read() por arquivo em vez de readline por linha
+    with open(fpath, 'rb') as f:
+        blob = f.read()
+    for line in blob.splitlines():
+        if not line.strip(): continue
+        try:
+            data = _json_loads(line)
+        except ValueError:  # JSONDecodeError (json e orjson)
+            continue
+        lot = data.get('lot', data)
+        lot_id = lot.get('lot_id')
+        if lot_id in seen: continue
+        seen.add(lot_id)
+        for k, append in targets:
+            append(lot.get(k))
+    return columns
+
+def _drop_seen(columns, seen):
+    """Remove das colunas de um arquivo os lotes já vistos em outros arquivos."""
+    keep = []
+    for i, lot_id in enumerate(columns['id']):
+        if lot_id in seen: continue
+        seen.add(lot_id)
+        keep.append(i)
+    if len(keep) == len(columns['id']):
+        return columns
+    return {col: [values[i] for i in keep] for col, values in columns.items()}
 
 def load_data(base_dirs):
-    all_lots = []
+    # Colunas (SoA) em vez de um dict por lote
+    lot_columns = {col: [] for col in _LOT_COLUMNS.values()}
+    # lot_ids já carregados: duplicados são descartados na leitura
+    seen = set()
     all_auctions = []
     
     # 1. Carregar Metadados dos Leilões (auctions.json)
@@ -27,8 +114,8 @@ def load_data(base_dirs):
         auctions_file = os.path.join(base_dir, "auctions.json")
         if os.path.exists(auctions_file):
             try:
-                with open(auctions_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(auctions_file, 'rb') as f:
+                    data = _json_loads(f.read())
                     # O arquivo pode ser uma lista de dicts
                     if isinstance(data, list):
                         all_auctions.extend(data)
@@ -45,50 +132,41 @@ def load_data(base_dirs):
             if c not in df_auctions.columns:
                 df_auctions[c] = None
         
+        # Um leilão pode aparecer em mais de uma pasta de output: mantém o primeiro
         df_auctions = df_auctions[cols].rename(columns={
             'number': 'leilao_numero',
             'city': 'leilao_cidade',
             'yard': 'leilao_patio'
-        })
+        }).drop_duplicates('auction_id').set_index('auction_id')
     
     # 2. Carregar Lotes (lots.jsonl)
     for base_dir in base_dirs:
-        pattern = os.path.join(base_dir, "**", "lots.jsonl")
-        files = glob.glob(pattern, recursive=True)
+        files = list(Path(base_dir).rglob('lots.jsonl'))
         
         print(f"Lendo {len(files)} arquivos de lotes em {base_dir}...")
         
-        for fpath in files:
-            with open(fpath, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if not line.strip(): continue
-                    try:
-                        data = json.loads(line)
-                        lot = data.get('lot', data)
-                        
-                        flat_lot = {
-                            'id': lot.get('lot_id'),
-                            'descricao': lot.get('description_short'),
-                            'modelo': lot.get('brand_model'),
-                            'ano': lot.get('year'),
-                            'situacao': lot.get('situation'),
-                            'lance_inicial': lot.get('start_bid'),
-                            'leilao_id': lot.get('auction_id'),
-                            'link': lot.get('lot_url')
-                        }
-                        all_lots.append(flat_lot)
-                    except json.JSONDecodeError:
-                        continue
-
-    df_lots = pd.DataFrame(all_lots)
-    
-    # 3. Cruzar Lotes com Leilões (Merge)
-    if not df_lots.empty and not df_auctions.empty:
-        # Left join para garantir que não perdemos lotes mesmo sem metadata de leilão
-        df_merged = pd.merge(df_lots, df_auctions, left_on='leilao_id', right_on='auction_id', how='left')
-        return df_merged
+        # DETRAN_PARALLEL=1: um processo por núcleo para o parse (CPU-bound) dos arquivos
+        if os.environ.get('DETRAN_PARALLEL') == '1' and len(files) > 1:
+            with ProcessPoolExecutor() as ex:
+                results = list(ex.map(_parse_jsonl_file, files, chunksize=4))
+            # Cada worker só deduplica o próprio arquivo; entre arquivos é aqui
+            results = [_drop_seen(r, seen) for r in results]
+        else:
+            results = (_parse_jsonl_file(fpath, seen) for fpath in files)
+
+        for file_columns in results:
+            for col, values in file_columns.items():
+                lot_columns[col].extend(values)
+
+    df_lots = pd.DataFrame(lot_columns)
     
-    return df_lots
+    # 3. Cruzar Lotes com Leilões
+    if df_lots.empty or df_auctions.empty:
+        return df_lots
+
+    # df_auctions já está indexado por auction_id: join many-to-one alinhado pelo
+    # índice (left, para não perder lotes sem metadata de leilão).
+    return df_lots.join(df_auctions, on='leilao_id', how='left')
 
 def analyze():
     dirs = ['out']
@@ -99,8 +177,9 @@ def analyze():
         return
 
     # Limpeza
-    df['lance_inicial'] = df['lance_inicial'].apply(clean_currency)
-    df['ano'] = pd.to_numeric(df['ano'], errors='coerce').fillna(0).astype(int)
+    df['lance_inicial'] = clean_currency(df['lance_inicial'])
+    # Anos (19xx/20xx, 0 = desconhecido) cabem em int16: 1/4 da memória de int64
+    df['ano'] = pd.to_numeric(df['ano'], errors='coerce', downcast='integer').fillna(0).astype('int16')
     
     # Preencher vazios de metadados se o merge falhou ou não existia info
     for col in ['leilao_cidade', 'leilao_numero']:
@@ -108,22 +187,13 @@ def analyze():
             df[col] = None
 
     # Fallback: Extrair número do leilão do ID se estiver vazio (ex: ...-2842-2026 -> 2842)
-    def extrair_numero_id(row):
-        if pd.notna(row['leilao_numero']) and row['leilao_numero'] != 'Desconhecido' and row['leilao_numero'] is not None:
-            return row['leilao_numero']
-        # Tenta extrair do ID: ...-lotes-2842-2026
-        match = re.search(r'-(\d+)-\d{4}$', str(row['leilao_id']))
-        if match:
-            return match.group(1)
-        return 'Desconhecido'
-
-    df['leilao_numero'] = df.apply(extrair_numero_id, axis=1)
+    numero_do_id = df['leilao_id'].astype('string').str.extract(_RX_AUCTION_TAIL, expand=False)
+    sem_numero = df['leilao_numero'].isna() | (df['leilao_numero'] == 'Desconhecido')
+    df['leilao_numero'] = df['leilao_numero'].mask(sem_numero, numero_do_id).fillna('Desconhecido')
     df['leilao_cidade'] = df['leilao_cidade'].fillna('Desconhecido')
 
-    # Remover duplicados (mesmo lote coletado em testes diferentes)
-    total_raw = len(df)
-    df = df.drop_duplicates(subset=['id'])
-    print(f"\nDados carregados: {total_raw} linhas. Únicos: {len(df)} lotes.")
+    # Duplicados (mesmo lote coletado em testes diferentes) já saem na leitura
+    print(f"\nDados carregados: {len(df)} lotes únicos.")
 
     # --- TRANSFORMAÇÕES PARA EXCEL ---
     
@@ -133,52 +203,52 @@ def analyze():
     df['modelo_veiculo'] = split_modelo[1].str.strip().str.upper()
     df['modelo_veiculo'] = df['modelo_veiculo'].fillna(df['marca'])
 
-    # 2. Limpar Descrição para pegar só "Lote X"
-    def extrair_nome_lote(texto):
-        if not isinstance(texto, str): return ""
-        match = re.search(r'(Lote\s*\d+[a-zA-Z]?)', texto, re.IGNORECASE)
-        if match:
-            return match.group(1).title()
-        return texto
+    # Colunas com poucos valores repetidos: categoria (códigos inteiros) para groupby/filtros
+    for c in ('marca', 'situacao', 'leilao_cidade', 'leilao_numero'):
+        df[c] = df[c].astype('category')
 
-    df['nome_lote'] = df['descricao'].apply(extrair_nome_lote)
+    # 2. Limpar Descrição para pegar só "Lote X" (sem match, mantém o texto original)
+    descricao = df['descricao'].astype('string')
+    df['nome_lote'] = (
+        descricao.str.extract(_RX_NOME_LOTE, expand=False)
+        .str.title()
+        .fillna(descricao)
+        .fillna('')
+    )
 
     # --- ANÁLISE 5: Lotes Faltantes (Controle de Qualidade) ---
     print("\n=== RELATÓRIO DE LOTES FALTANTES ===")
     
-    # Agrupa por leilão (usando leilao_id do DF completo)
-    leiloes = df.groupby('leilao_id')
-    
+    # Número de cada lote extraído de uma vez só (vetorizado)
+    numeros = pd.to_numeric(
+        df['nome_lote'].astype('string').str.extract(_RX_LOTE_NUM, expand=False), errors='coerce'
+    ).astype('Int64')
+
+    # Agrupa por leilão (usando leilao_id do DF completo): só há lacuna quando o
+    # intervalo [min, max] tem mais inteiros do que números distintos encontrados.
+    por_leilao = numeros.groupby(df['leilao_id'])
+    faixas = por_leilao.agg(['min', 'max', 'nunique']).dropna()
+    com_lacunas = faixas[(faixas['max'] - faixas['min'] + 1) != faixas['nunique']]
+    # Primeira linha de cada leilão (número/cidade exibidos no relatório)
+    primeiros = df.drop_duplicates('leilao_id').set_index('leilao_id')
+
     found_gaps = False
-    for leilao_id, grupo in leiloes:
-        numero_leilao = grupo['leilao_numero'].iloc[0]
-        cidade_leilao = grupo['leilao_cidade'].iloc[0]
-        
-        numeros = []
-        for nome in grupo['nome_lote']:
-            if not isinstance(nome, str): continue
-            match = re.search(r'(\d+)', nome)
-            if match:
-                numeros.append(int(match.group(1)))
-        
-        if not numeros: continue
-            
-        numeros = sorted(list(set(numeros)))
-        if not numeros: continue
-            
-        min_lote = numeros[0]
-        max_lote = numeros[-1]
-        
-        esperados = set(range(min_lote, max_lote + 1))
-        encontrados = set(numeros)
-        
-        faltantes = sorted(list(esperados - encontrados))
-        
-        if faltantes:
-            print(f"Leilão {numero_leilao} ({cidade_leilao}):")
-            print(f"  -> Intervalo detectado: {min_lote} a {max_lote}")
-            print(f"  -> Faltam {len(faltantes)} lotes: {faltantes}")
-            found_gaps = True
+    for leilao_id, faixa in com_lacunas.iterrows():
+        min_lote = int(faixa['min'])
+        max_lote = int(faixa['max'])
+
+        # Máscara booleana do intervalo: marca os presentes, faltantes = posições livres
+        encontrados = por_leilao.get_group(leilao_id).dropna().to_numpy(dtype='int64')
+        presentes = np.zeros(max_lote - min_lote + 1, dtype=bool)
+        presentes[encontrados - min_lote] = True
+        faltantes = (np.flatnonzero(~presentes) + min_lote).tolist()
+
+        numero_leilao = primeiros.at[leilao_id, 'leilao_numero']
+        cidade_leilao = primeiros.at[leilao_id, 'leilao_cidade']
+        print(f"Leilão {numero_leilao} ({cidade_leilao}):")
+        print(f"  -> Intervalo detectado: {min_lote} a {max_lote}")
+        print(f"  -> Faltam {len(faltantes)} lotes: {faltantes}")
+        found_gaps = True
             
     if not found_gaps:
         print("Nenhum lote faltando nas sequências encontradas!")
@@ -224,7 +294,12 @@ def analyze():
 
     # Exportar
     output_csv = 'relatorio_leiloes.csv'
-    df_final.to_csv(output_csv, index=False, sep=';', decimal=',')
+    # Vírgula decimal pré-formatada numa passada vetorizada: evita o caminho lento
+    # de formatação float a float do to_csv(decimal=','). Lance ausente (NaN)
+    # continua vazio na planilha, e não o texto "nan" do astype(str) no pandas 2.
+    lances = df_final['lance_inicial']
+    df_final['lance_inicial'] = lances.astype(str).str.replace('.', ',', regex=False).where(lances.notna())
+    df_final.to_csv(output_csv, index=False, sep=';')
     print(f"\nArquivo gerado com sucesso: {output_csv}")
     print("Colunas separadas: [leilao_cidade] [leilao_numero] [nome_lote] [situacao] [marca] [modelo_veiculo] ...")
 
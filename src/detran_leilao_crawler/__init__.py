@@ -1,6 +1,6 @@
 """DETRAN-MG auction crawler (ethical).
 
-This package provides a Playwright-first crawler with a requests/BS4 fallback,
+This package provides a Playwright-first crawler with a requests/lxml fallback,
 rate limiting, retries, checkpointing, and filtering/export.
 """
 
@@ -6,18 +6,37 @@ import re
 import urllib.parse
 from dataclasses import asdict
 from datetime import datetime
-from typing import Any, Iterable, Optional
-
-from dateutil import parser as dateparser
+from typing import Any, Iterable, Optional, Sequence
 
 from .logging_utils import safe_float
 from .models import Lot
+from .parsers import parse_datetime_loose
 
 
 logger = logging.getLogger(__name__)
 
 
 _SENSITIVE_HEADERS = {"authorization", "cookie", "set-cookie", "x-api-key"}
+_RX_YEAR = re.compile(r"(19\d{2}|20\d{2})")
+
+# Key lists probed on every JSON item (hoisted so loops don't rebuild them).
+_CANDIDATE_LIST_KEYS = ("items", "content", "data", "result", "results", "registros", "lotes", "lots", "rows")
+_LOT_ID_KEYS = ("lotId", "loteId", "id", "lote", "numeroLote", "numLote", "codigoLote", "codigo", "numero")
+_DESC_KEYS = ("descricaoCurta", "descricao", "descricaoResumida", "nome", "titulo", "title")
+_BRAND_KEYS = ("marcaModelo", "marca_modelo", "marca", "brand")
+_MODEL_KEYS = ("modelo", "model")
+_YEAR_KEYS = ("ano", "anoModelo", "ano_modelo", "anoFabricacao", "ano_fabricacao", "year")
+_SITUATION_KEYS = ("situacao", "status", "tipo", "categoria")
+_START_BID_KEYS = ("lanceInicial", "valorInicial", "valorMinimo", "precoInicial", "startBid")
+_ENDS_AT_KEYS = ("dataEncerramento", "encerramento", "fim", "endsAt")
+_LOT_URL_KEYS = ("url", "link", "detalheUrl", "detailsUrl")
+_IMAGES_KEYS = ("imagens", "images", "fotos", "fotosUrl", "photos")
+_IMAGE_URL_KEYS = ("url", "src", "caminho", "path")
+_TOTAL_PAGES_KEYS = ("totalPages", "total_pages", "paginas", "qtdPaginas", "lastPage")
+
+# Lowercase keys hinting that a list of dicts holds lots.
+_LOT_ID_HINTS = frozenset({"lote", "loteid", "id", "numero", "numerolote", "codigolote"})
+_BRAND_MODEL_HINTS = frozenset({"modelo", "marca", "marcamodelo"})
 
 
 def redact_headers(headers: dict[str, str]) -> dict[str, str]:
@@ -30,38 +49,36 @@ def redact_headers(headers: dict[str, str]) -> dict[str, str]:
     return redacted
 
 
-def _iter_candidate_item_lists(obj: Any) -> Iterable[list[Any]]:
+def _iter_candidate_item_lists(obj: Any, path: tuple[str, ...] = ()) -> Iterable[tuple[tuple[str, ...], list[Any]]]:
     if isinstance(obj, list):
-        yield obj
+        yield path, obj
         return
     if not isinstance(obj, dict):
         return
 
     # Common containers
-    for key in [
-        "items",
-        "content",
-        "data",
-        "result",
-        "results",
-        "registros",
-        "lotes",
-        "lots",
-        "rows",
-    ]:
+    for key in _CANDIDATE_LIST_KEYS:
         v = obj.get(key)
         if isinstance(v, list):
-            yield v
+            yield path + (key,), v
         elif isinstance(v, dict):
-            yield from _iter_candidate_item_lists(v)
+            yield from _iter_candidate_item_lists(v, path + (key,))
 
     # Any list-of-dicts value
-    for v in obj.values():
+    for k, v in obj.items():
         if isinstance(v, list) and v and isinstance(v[0], (dict, str, int)):
-            yield v
+            yield path + (k,), v
+
 
+def _items_at(obj: Any, path: tuple[str, ...]) -> Optional[list[Any]]:
+    for key in path:
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+    return obj if isinstance(obj, list) else None
 
-def _get_first(obj: dict[str, Any], keys: list[str]) -> Optional[Any]:
+
+def _get_first(obj: dict[str, Any], keys: Sequence[str]) -> Optional[Any]:
     for k in keys:
         if k in obj and obj[k] is not None:
             return obj[k]
@@ -74,6 +91,19 @@ def _get_first(obj: dict[str, Any], keys: list[str]) -> Optional[Any]:
     return None
 
 
+def _get_first_lc(obj: dict[str, Any], lc: dict[str, Any], keys: Sequence[str]) -> Optional[Any]:
+    """Like `_get_first`, with the lowercase key map `lc` built once by the caller."""
+    for k in keys:
+        if k in obj and obj[k] is not None:
+            return obj[k]
+    # also try case-insensitive
+    for k in keys:
+        kk = lc.get(k.lower())
+        if kk is not None and obj[kk] is not None:
+            return obj[kk]
+    return None
+
+
 def _parse_dt(value: Any) -> Optional[datetime]:
     if value is None:
         return None
@@ -92,19 +122,16 @@ def _parse_dt(value: Any) -> Optional[datetime]:
         if not s:
             return None
         try:
-            return datetime.fromisoformat(s.replace("Z", "+00:00"))
+            return datetime.fromisoformat(s)
         except Exception:
-            try:
-                return dateparser.parse(s, dayfirst=True, fuzzy=True)
-            except Exception:  # noqa: BLE001
-                return None
+            return parse_datetime_loose(s)
     return None
 
 
 def get_total_pages(obj: Any) -> Optional[int]:
     if not isinstance(obj, dict):
         return None
-    v = _get_first(obj, ["totalPages", "total_pages", "paginas", "qtdPaginas", "lastPage"])
+    v = _get_first(obj, _TOTAL_PAGES_KEYS)
     if isinstance(v, (int, float)):
         try:
             return int(v)
@@ -113,126 +140,127 @@ def get_total_pages(obj: Any) -> Optional[int]:
     return None
 
 
-def extract_lots_from_json(obj: Any, auction_id: str) -> list[Lot]:
+def _lots_from_items(items: list[Any], auction_id: str) -> list[Lot]:
     lots: list[Lot] = []
+    if not items:
+        return lots
+    # Filter to dict-like items
+    dict_items = [x for x in items if isinstance(x, dict)]
+    if not dict_items:
+        return lots
+
+    # Heuristic: must contain something that looks like lote id/description
+    score = 0
+    sample = dict_items[0]
+    sample_keys = {k.lower() for k in sample.keys()}
+    if sample_keys & _LOT_ID_HINTS:
+        score += 1
+    if any("desc" in k for k in sample_keys) or sample_keys & _BRAND_MODEL_HINTS:
+        score += 1
+    if score == 0:
+        return lots
+
+    for it in dict_items:
+        lc = {str(k).lower(): k for k in it.keys()}
+
+        lot_id = _get_first_lc(it, lc, _LOT_ID_KEYS)
+        lot_id_s = str(lot_id) if lot_id is not None else "unknown"
+
+        desc = _get_first_lc(it, lc, _DESC_KEYS)
+        desc_s = str(desc).strip() if desc is not None else "(sem descrição)"
+
+        brand = _get_first_lc(it, lc, _BRAND_KEYS)
+        model = _get_first_lc(it, lc, _MODEL_KEYS)
+        brand_model = None
+        if brand and model:
+            brand_model = f"{brand} {model}".strip()
+        elif brand:
+            brand_model = str(brand).strip()
+        elif model:
+            brand_model = str(model).strip()
+
+        year = _get_first_lc(it, lc, _YEAR_KEYS)
+        year_i: Optional[int] = None
+        try:
+            if year is not None and str(year).strip():
+                m = _RX_YEAR.search(str(year))
+                if m:
+                    year_i = int(m.group(1))
+        except Exception:
+            year_i = None
 
-    for items in _iter_candidate_item_lists(obj):
-        if not items:
-            continue
-        # Filter to dict-like items
-        dict_items = [x for x in items if isinstance(x, dict)]
-        if not dict_items:
-            continue
-
-        # Heuristic: must contain something that looks like lote id/description
-        score = 0
-        sample = dict_items[0]
-        sample_keys = {k.lower() for k in sample.keys()}
-        if any(k in sample_keys for k in ["lote", "loteid", "id", "numero", "numerolote", "codigolote"]):
-            score += 1
-        if any("desc" in k for k in sample_keys) or any(k in sample_keys for k in ["modelo", "marca", "marcamodelo"]):
-            score += 1
-        if score == 0:
-            continue
-
-        for it in dict_items:
-            lot_id = _get_first(
-                it,
-                [
-                    "lotId",
-                    "loteId",
-                    "id",
-                    "lote",
-                    "numeroLote",
-                    "numLote",
-                    "codigoLote",
-                    "codigo",
-                    "numero",
-                ],
-            )
-            lot_id_s = str(lot_id) if lot_id is not None else "unknown"
-
-            desc = _get_first(
-                it,
-                [
-                    "descricaoCurta",
-                    "descricao",
-                    "descricaoResumida",
-                    "nome",
-                    "titulo",
-                    "title",
-                ],
-            )
-            desc_s = str(desc).strip() if desc is not None else "(sem descrição)"
-
-            brand = _get_first(it, ["marcaModelo", "marca_modelo", "marca", "brand"])
-            model = _get_first(it, ["modelo", "model"])
-            brand_model = None
-            if brand and model:
-                brand_model = f"{brand} {model}".strip()
-            elif brand:
-                brand_model = str(brand).strip()
-            elif model:
-                brand_model = str(model).strip()
-
-            year = _get_first(it, ["ano", "anoModelo", "ano_modelo", "anoFabricacao", "ano_fabricacao", "year"])
-            year_i: Optional[int] = None
-            try:
-                if year is not None and str(year).strip():
-                    m = re.search(r"(19\d{2}|20\d{2})", str(year))
-                    if m:
-                        year_i = int(m.group(1))
-            except Exception:
-                year_i = None
-
-            situation = _get_first(it, ["situacao", "status", "tipo", "categoria"])
-            situation_s = str(situation).strip() if situation is not None else None
-
-            start_bid = _get_first(it, ["lanceInicial", "valorInicial", "valorMinimo", "precoInicial", "startBid"])
-            start_bid_f = None
-            if isinstance(start_bid, (int, float)):
-                start_bid_f = float(start_bid)
-            else:
-                start_bid_f = safe_float(str(start_bid)) if start_bid is not None else None
-
-            ends_at = _parse_dt(_get_first(it, ["dataEncerramento", "encerramento", "fim", "endsAt"]))
-
-            lot_url = _get_first(it, ["url", "link", "detalheUrl", "detailsUrl"])
-            lot_url_s = str(lot_url).strip() if lot_url is not None else None
-
-            imgs_val = _get_first(it, ["imagens", "images", "fotos", "fotosUrl", "photos"])
-            image_urls: list[str] = []
-            if isinstance(imgs_val, list):
-                for im in imgs_val:
-                    if isinstance(im, str):
-                        image_urls.append(im)
-                    elif isinstance(im, dict):
-                        u = _get_first(im, ["url", "src", "caminho", "path"])
-                        if u:
-                            image_urls.append(str(u))
-
-            lots.append(
-                Lot(
-                    auction_id=auction_id,
-                    lot_id=lot_id_s,
-                    description_short=desc_s[:180],
-                    brand_model=brand_model,
-                    year=year_i,
-                    situation=situation_s,
-                    start_bid=start_bid_f,
-                    ends_at=ends_at,
-                    lot_url=lot_url_s,
-                    image_urls=tuple(image_urls),
-                    requires_login=False,
-                    raw_text=None,
-                )
+        situation = _get_first_lc(it, lc, _SITUATION_KEYS)
+        situation_s = str(situation).strip() if situation is not None else None
+
+        start_bid = _get_first_lc(it, lc, _START_BID_KEYS)
+        start_bid_f = None
+        if isinstance(start_bid, (int, float)):
+            start_bid_f = float(start_bid)
+        else:
+            start_bid_f = safe_float(str(start_bid)) if start_bid is not None else None
+
+        ends_at = _parse_dt(_get_first_lc(it, lc, _ENDS_AT_KEYS))
+
+        lot_url = _get_first_lc(it, lc, _LOT_URL_KEYS)
+        lot_url_s = str(lot_url).strip() if lot_url is not None else None
+
+        imgs_val = _get_first_lc(it, lc, _IMAGES_KEYS)
+        image_urls: list[str] = []
+        if isinstance(imgs_val, list):
+            for im in imgs_val:
+                if isinstance(im, str):
+                    image_urls.append(im)
+                elif isinstance(im, dict):
+                    u = _get_first(im, _IMAGE_URL_KEYS)
+                    if u:
+                        image_urls.append(str(u))
+
+        lots.append(
+            Lot(
+                auction_id=auction_id,
+                lot_id=lot_id_s,
+                description_short=desc_s[:180],
+                brand_model=brand_model,
+                year=year_i,
+                situation=situation_s,
+                start_bid=start_bid_f,
+                ends_at=ends_at,
+                lot_url=lot_url_s,
+                image_urls=tuple(image_urls),
+                requires_login=False,
+                raw_text=None,
             )
+        )
+
+    return lots
+
+
+def find_lots_in_json(
+    obj: Any, auction_id: str, key_path: Optional[tuple[str, ...]] = None
+) -> tuple[list[Lot], Optional[tuple[str, ...]]]:
+    """Extract lots and the key path (e.g. ("data", "content")) of the list they came from.
+
+    `key_path` is an optional hint from an earlier page of the same endpoint; it
+    is probed first, then the usual heuristic scan runs.
+    """
+    if key_path is not None:
+        items = _items_at(obj, key_path)
+        if items is not None:
+            lots = _lots_from_items(items, auction_id)
+            if lots:
+                return lots, key_path
 
+    for path, items in _iter_candidate_item_lists(obj):
+        lots = _lots_from_items(items, auction_id)
         # If we successfully parsed from a good list, stop at first plausible list.
         if lots:
-            return lots
+            return lots, path
 
-    return lots
+    return [], None
+
+
+def extract_lots_from_json(obj: Any, auction_id: str) -> list[Lot]:
+    return find_lots_in_json(obj, auction_id)[0]
 
 
 def paginate_url(url: str, page_num: int) -> str:
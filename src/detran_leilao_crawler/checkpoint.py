@@ -1,9 +1,26 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Set
+from typing import Any, Dict, Set
+
+import orjson
+
+
+def _encode_pages(pages: Set[int]) -> str:
+    """Encode a set of page numbers as a hex bitmap (bit N set = page N done)."""
+    bits = 0
+    for p in pages:
+        bits |= 1 << p
+    return hex(bits)
+
+
+def _decode_pages(value: Any) -> Set[int]:
+    # Older checkpoints stored a sorted list of page numbers.
+    if isinstance(value, list):
+        return set(value)
+    digits = bin(int(value, 16))[:1:-1]  # least significant bit first
+    return {p for p, d in enumerate(digits) if d == "1"}
 
 
 @dataclass
@@ -14,16 +31,19 @@ class CrawlCheckpoint:
     def load(self) -> None:
         if not self.path.exists():
             return
-        data = json.loads(self.path.read_text(encoding="utf-8"))
-        self.pages_done = {k: set(v) for k, v in data.get("pages_done", {}).items()}
+        data = orjson.loads(self.path.read_bytes())
+        self.pages_done = {k: _decode_pages(v) for k, v in data.get("pages_done", {}).items()}
 
     def save(self) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        data = {"pages_done": {k: sorted(list(v)) for k, v in self.pages_done.items()}}
-        self.path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        data = {"pages_done": {k: _encode_pages(v) for k, v in self.pages_done.items()}}
+        self.path.write_bytes(orjson.dumps(data))
 
     def is_page_done(self, auction_id: str, page: int) -> bool:
         return page in self.pages_done.get(auction_id, set())
 
     def mark_page_done(self, auction_id: str, page: int) -> None:
         self.pages_done.setdefault(auction_id, set()).add(page)
+
+    def has_progress(self, auction_id: str) -> bool:
+        return bool(self.pages_done.get(auction_id))
@@ -5,11 +5,13 @@ import logging
 from pathlib import Path
 import shutil
 
+import orjson
+
 from .config import load_filters_config
 from .filters import FilterEngine, filter_lots
 from .logging_utils import setup_logging
 from .models import LotImage
-from .crawler import DetranLeilaoCrawler
+from .crawler import DEFAULT_CONCURRENCY, DetranLeilaoCrawler
 from .serde import auction_from_dict, lot_from_dict
 from .storage import init_sqlite, upsert_sqlite, write_csv, write_json
 
@@ -26,27 +28,28 @@ def _cmd_crawl(args: argparse.Namespace) -> None:
         headless=args.headless,
         rate_limit_per_sec=args.rate_limit,
         timeout_sec=args.timeout,
+        concurrency=args.concurrency,
     )
     crawler.init()
+    try:
+        auctions = crawler.discover_auctions(max_auctions=args.max_auctions)
+        logger.info("Discovered %d auctions", len(auctions))
 
-    auctions = crawler.discover_auctions(max_auctions=args.max_auctions)
-    logger.info("Discovered %d auctions", len(auctions))
-
-    enriched_auctions = []
-    for a in auctions:
-        enriched_auctions.append(crawler.enrich_auction_metadata(a))
+        enriched_auctions = crawler.enrich_auctions(auctions)
 
-    auctions_path = output_dir / "auctions.json"
-    write_json(auctions_path, enriched_auctions)
+        auctions_path = output_dir / "auctions.json"
+        write_json(auctions_path, enriched_auctions)
 
-    all_lots = []
-    for a in enriched_auctions:
-        lots = crawler.crawl_auction_lots(a, max_pages=args.max_pages, dry_run=args.dry_run)
-        logger.info("Auction %s: %d lots", a.auction_id, len(lots))
-        all_lots.extend(lots)
+        all_lots = []
+        per_auction = crawler.crawl_auctions_lots(enriched_auctions, max_pages=args.max_pages, dry_run=args.dry_run)
+        for a, lots in zip(enriched_auctions, per_auction):
+            logger.info("Auction %s: %d lots", a.auction_id, len(lots))
+            all_lots.extend(lots)
 
-    write_json(output_dir / "lots.json", all_lots)
-    logger.info("Total lots collected: %d", len(all_lots))
+        write_json(output_dir / "lots.json", all_lots)
+        logger.info("Total lots collected: %d", len(all_lots))
+    finally:
+        crawler.close()
 
 
 def _cmd_filter(args: argparse.Namespace) -> None:
@@ -56,10 +59,7 @@ def _cmd_filter(args: argparse.Namespace) -> None:
 
     setup_logging(output_dir)
 
-    lots = (input_dir / "lots.json").read_text(encoding="utf-8")
-    import json
-
-    lots_data = json.loads(lots)
+    lots_data = orjson.loads((input_dir / "lots.json").read_bytes())
 
     lots_objs = [lot_from_dict(d) for d in lots_data]
 
@@ -82,15 +82,13 @@ def _cmd_export(args: argparse.Namespace) -> None:
 
     setup_logging(output_dir)
 
-    import json
-
-    auctions = [auction_from_dict(d) for d in json.loads((input_dir / "auctions.json").read_text(encoding="utf-8"))]
+    auctions = [auction_from_dict(d) for d in orjson.loads((input_dir / "auctions.json").read_bytes())]
 
     # Prefer filtered file if present
     lots_path = input_dir / "lots.filtered.json"
     if not lots_path.exists():
         lots_path = input_dir / "lots.json"
-    lots = [lot_from_dict(d) for d in json.loads(lots_path.read_text(encoding="utf-8"))]
+    lots = [lot_from_dict(d) for d in orjson.loads(lots_path.read_bytes())]
 
     # Images table rows
     images = []
@@ -124,6 +122,7 @@ def build_parser() -> argparse.ArgumentParser:
     crawl.add_argument("--max-pages", type=int, default=None)
     crawl.add_argument("--rate-limit", type=float, default=0.5, help="Requests per second")
     crawl.add_argument("--timeout", type=float, default=30.0)
+    crawl.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Auctions processed in parallel")
     crawl.add_argument("--output-dir", type=str, required=True)
     crawl.set_defaults(func=_cmd_crawl)
 
@@ -1,40 +1,94 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
-from dataclasses import asdict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Coroutine, Optional, TypeVar
 
+import orjson
 import requests
-from playwright.sync_api import Page, sync_playwright
+from requests.adapters import HTTPAdapter
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, Response, Route, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from .checkpoint import CrawlCheckpoint
-from .logging_utils import jsonl_append
-from .models import Auction, Lot
+from .logging_utils import jsonl_append_many
+from .models import Auction, Lot, lot_to_dict
 from .api_json import (
-    extract_lots_from_json,
+    find_lots_in_json,
     get_total_pages,
     paginate_payload,
     paginate_url,
     redact_headers,
 )
 from .parsers import (
+    LOT_CARD_SELECTOR,
     parse_auction_cards_from_home,
     parse_auction_details_from_html,
+    parse_lot_cards_from_fragments,
     parse_lot_cards_from_html,
 )
 from .rate_limit import RateLimiter
-from .retry import RetryPolicy, retry_call
+from .retry import RetryPolicy, urllib3_retry
 from .robots import RobotsPolicy
 from .serde import lot_from_dict
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 BASE_URL = "https://leilao.detran.mg.gov.br/"
 DEFAULT_UA = "detran-leilao-crawler/0.1 (+ethical; respects robots.txt)"
+DEFAULT_CONCURRENCY = 3
+
+# Threads for the blocking requests fallback (see _requests_get_async).
+_FALLBACK_WORKERS = 8
+
+# Buffered network-log entries are written out at least this often.
+_NETWORK_FLUSH_EVERY = 50
+
+# JSON responses that are never lot listings (trackers, captcha, telemetry): their
+# bodies are not parsed or kept for the JSON-first lot search.
+_SKIP_BODY_URLS = re.compile(r"analytics|gtm|google|facebook|captcha|telemetry|/track", re.IGNORECASE)
+_MAX_BODY_BYTES = 2_000_000
+# Only the most recent JSON responses are considered as lot-listing candidates.
+_JSON_TRAFFIC_KEEP = 200
+
+# Accessible-name / text patterns for the site's controls.
+_RE_DETALHES = re.compile(r"detalhes", re.IGNORECASE)
+_RE_CARREGAR = re.compile(r"carregar|mais", re.IGNORECASE)
+_RE_NEXT = re.compile(r"próx|next|>+", re.IGNORECASE)
+
+# Resource types the crawler never needs: image URLs are read from attributes,
+# and only DOM text/markup is parsed.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# Elements whose presence means a page has rendered what we parse.
+_HOME_READY_SELECTOR = "a:has-text('Detalhes')"
+_AUCTION_READY_SELECTOR = f"{LOT_CARD_SELECTOR}, h4"
+# Cap on those waits, separate from the navigation timeout: pages that never render
+# a lot card (no lots, fallback-only or JSON-only listings) are parsed after this.
+_CONTENT_WAIT_SEC = 5.0
+
+
+def _extend_unique(dst: list[Lot], seen: set[str], lots: list[Lot]) -> None:
+    """Append lots whose lot_id is not in `seen` yet (first occurrence wins)."""
+    for l in lots:
+        if l.lot_id not in seen:
+            seen.add(l.lot_id)
+            dst.append(l)
+
+
+async def _block_heavy_resources(route: Route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
 
 
 class DetranLeilaoCrawler:
@@ -45,18 +99,47 @@ class DetranLeilaoCrawler:
         rate_limit_per_sec: float,
         timeout_sec: float = 30.0,
         user_agent: str = DEFAULT_UA,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> None:
         self.output_dir = output_dir
         self.headless = headless
         self.timeout_sec = timeout_sec
         self.user_agent = user_agent
+        self.concurrency = max(1, concurrency)
 
         self.rate_limiter = RateLimiter(rate_limit_per_sec)
-        self.robots = RobotsPolicy(BASE_URL, user_agent=user_agent)
         self.checkpoint = CrawlCheckpoint(path=output_dir / ".checkpoint" / "state.json")
 
         self.retry_policy = RetryPolicy()
+        # Keep-alive session shared by every fallback request; headers are set once here.
+        # Transient failures (connect/read errors, 429/5xx) are retried with backoff
+        # by urllib3 inside the adapter.
         self._session = requests.Session()
+        self._session.headers.update({"User-Agent": self.user_agent})
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=urllib3_retry(self.retry_policy))
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self.robots = RobotsPolicy(
+            BASE_URL,
+            user_agent=user_agent,
+            session=self._session,
+            cache_path=output_dir / ".checkpoint" / "robots.txt",
+        )
+
+        # One browser per crawler run (started lazily); each task gets its own context.
+        # Playwright lives on the crawler's own event loop so the browser survives
+        # across the sync entry points below.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pw: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._browser_lock = asyncio.Lock()
+
+        # Network audit lines waiting to be written: (log path, entry).
+        self._network_buf: list[tuple[Path, dict[str, Any]]] = []
+
+        # Per auction: lot_id -> last Lot written to raw/<auction_id>/lots.jsonl.
+        self._lots_written: dict[str, dict[str, Lot]] = {}
 
     def _respect(self, url: str) -> bool:
         ok = self.robots.can_fetch(url)
@@ -69,21 +152,80 @@ class DetranLeilaoCrawler:
         self.robots.load()
         self.checkpoint.load()
 
+    def close(self) -> None:
+        """Release the shared browser, event loop and HTTP session."""
+        self.flush_network_log()
+        self._session.close()
+        if self._loop is None:
+            return
+        self._loop.run_until_complete(self._close_browser())
+        self._loop.run_until_complete(self._loop.shutdown_default_executor())
+        self._loop.close()
+        self._loop = None
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.set_default_executor(ThreadPoolExecutor(max_workers=_FALLBACK_WORKERS))
+        return self._loop.run_until_complete(coro)
+
+    async def _gather_bounded(self, coros: list[Coroutine[Any, Any, T]]) -> list[T]:
+        """Await coroutines with at most `concurrency` in flight; results keep input order."""
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(coro: Coroutine[Any, Any, T]) -> T:
+            async with sem:
+                return await coro
+
+        return list(await asyncio.gather(*(bounded(c) for c in coros)))
+
+    async def _close_browser(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            await self._pw.stop()
+            self._pw = None
+
+    async def _new_context(self) -> BrowserContext:
+        """Open a fresh context on the shared browser, launching it on first use.
+
+        Launching Chromium costs seconds; doing it once per run instead of once per
+        auction/page task dominates long crawls.
+        """
+        async with self._browser_lock:
+            if self._pw is None:
+                self._pw = await async_playwright().start()
+            if self._browser is None:
+                self._browser = await self._pw.chromium.launch(headless=self.headless)
+        context = await self._browser.new_context(user_agent=self.user_agent)
+        await context.route("**/*", _block_heavy_resources)
+        return context
+
+    async def _wait_for_content(self, page: Page, selector: str) -> None:
+        """Wait (best-effort, at most _CONTENT_WAIT_SEC) until `selector` is visible.
+
+        Used instead of "networkidle", which analytics/long-poll requests can hold off
+        until the timeout even though the content is already there.
+        """
+        timeout_sec = min(self.timeout_sec, _CONTENT_WAIT_SEC)
+        try:
+            await page.wait_for_selector(selector, state="visible", timeout=int(timeout_sec * 1000))
+        except PlaywrightTimeoutError:
+            logger.debug("Timed out waiting for %r on %s", selector, page.url)
+
     def _requests_get(self, url: str) -> str:
         if not self._respect(url):
             raise RuntimeError(f"Blocked by robots.txt: {url}")
 
-        def _do() -> str:
-            self.rate_limiter.wait()
-            r = self._session.get(url, headers={"User-Agent": self.user_agent}, timeout=self.timeout_sec)
-            r.raise_for_status()
-            return r.text
-
-        def _should_retry(exc: Exception) -> bool:
-            # Retry transient network/server errors.
-            return isinstance(exc, (requests.Timeout, requests.ConnectionError, requests.HTTPError))
+        self.rate_limiter.wait()
+        r = self._session.get(url, timeout=self.timeout_sec)
+        r.raise_for_status()
+        return r.text
 
-        return retry_call(_do, policy=self.retry_policy, should_retry=_should_retry)
+    async def _requests_get_async(self, url: str) -> str:
+        """_requests_get on the loop's thread pool, so concurrent fallbacks don't block each other."""
+        return await asyncio.to_thread(self._requests_get, url)
 
     def discover_auctions(self, max_auctions: Optional[int] = None) -> list[Auction]:
         """Discover auctions from home.
@@ -92,92 +234,94 @@ class DetranLeilaoCrawler:
         1) Playwright: render + allow dynamic content.
         2) Fallback: requests + HTML parse.
         """
+        return self._run(self._discover_auctions_async(max_auctions=max_auctions))
+
+    async def _discover_auctions_async(self, max_auctions: Optional[int]) -> list[Auction]:
         if not self._respect(BASE_URL):
             return []
 
         try:
-            return self._discover_auctions_playwright(max_auctions=max_auctions)
+            return await self._discover_auctions_playwright(max_auctions=max_auctions)
         except Exception as exc:  # noqa: BLE001
-            logger.warning("Playwright discover failed (%s). Falling back to requests/BS4.", exc)
-            return self._discover_auctions_requests(max_auctions=max_auctions)
+            logger.warning("Playwright discover failed (%s). Falling back to requests/lxml.", exc)
+            return await self._discover_auctions_requests(max_auctions=max_auctions)
 
     def enrich_auction_metadata(self, auction: Auction) -> Auction:
         """Fetch auction details page and parse metadata defensively.
 
         Playwright is preferred (JS-heavy pages). Fallback to requests.
         """
+        return self._run(self._enrich_auction_async(auction))
+
+    def enrich_auctions(self, auctions: list[Auction]) -> list[Auction]:
+        """Enrich several auctions, up to `concurrency` at a time (input order is kept)."""
+        return self._run(self._gather_bounded([self._enrich_auction_async(a) for a in auctions]))
+
+    async def _enrich_auction_async(self, auction: Auction) -> Auction:
         if not self._respect(auction.url):
             return auction
 
         try:
-            return self._enrich_auction_playwright(auction)
+            return await self._enrich_auction_playwright(auction)
         except Exception as exc:  # noqa: BLE001
             logger.info("Auction metadata enrichment via Playwright failed (%s). Trying requests.", exc)
             try:
-                html = self._requests_get(auction.url)
+                html = await self._requests_get_async(auction.url)
                 return parse_auction_details_from_html(html, auction)
             except Exception as exc2:  # noqa: BLE001
                 logger.info("Auction metadata enrichment via requests failed (%s).", exc2)
                 return auction
 
-    def _enrich_auction_playwright(self, auction: Auction) -> Auction:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            context = browser.new_context(user_agent=self.user_agent)
-            page = context.new_page()
+    async def _enrich_auction_playwright(self, auction: Auction) -> Auction:
+        context = await self._new_context()
+        try:
+            page = await context.new_page()
 
             self._attach_network_logger(page, auction_id=auction.auction_id)
 
-            self.rate_limiter.wait()
-            page.goto(auction.url, wait_until="domcontentloaded", timeout=int(self.timeout_sec * 1000))
-            page.wait_for_load_state("networkidle", timeout=int(self.timeout_sec * 1000))
+            await self.rate_limiter.wait_async()
+            await page.goto(auction.url, wait_until="domcontentloaded", timeout=int(self.timeout_sec * 1000))
+            await self._wait_for_content(page, _AUCTION_READY_SELECTOR)
 
-            enriched = parse_auction_details_from_html(page.content(), auction)
+            return parse_auction_details_from_html(await page.content(), auction)
+        finally:
+            self.flush_network_log()
+            await context.close()
 
-            context.close()
-            browser.close()
-            return enriched
-
-    def _discover_auctions_requests(self, max_auctions: Optional[int]) -> list[Auction]:
-        html = self._requests_get(BASE_URL)
+    async def _discover_auctions_requests(self, max_auctions: Optional[int]) -> list[Auction]:
+        html = await self._requests_get_async(BASE_URL)
         auctions = parse_auction_cards_from_home(html, base_url=BASE_URL)
         if max_auctions is not None:
             auctions = auctions[:max_auctions]
         return auctions
 
-    def _discover_auctions_playwright(self, max_auctions: Optional[int]) -> list[Auction]:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            context = browser.new_context(user_agent=self.user_agent)
-            page = context.new_page()
+    async def _discover_auctions_playwright(self, max_auctions: Optional[int]) -> list[Auction]:
+        context = await self._new_context()
+        try:
+            page = await context.new_page()
 
             network_log = self.output_dir / "network.jsonl"
 
             # Log only endpoint metadata (avoid storing response bodies).
             self._attach_network_logger(page)
 
-            self.rate_limiter.wait()
-            page.goto(BASE_URL, wait_until="domcontentloaded", timeout=int(self.timeout_sec * 1000))
-            page.wait_for_load_state("networkidle", timeout=int(self.timeout_sec * 1000))
-
+            await self.rate_limiter.wait_async()
+            await page.goto(BASE_URL, wait_until="domcontentloaded", timeout=int(self.timeout_sec * 1000))
             # Wait until at least one 'Detalhes' link appears (if present)
-            try:
-                page.locator("a", has_text=re.compile(r"detalhes", re.IGNORECASE)).first.wait_for(timeout=5000)
-            except Exception:
-                pass
+            await self._wait_for_content(page, _HOME_READY_SELECTOR)
+            details_links = page.locator("a", has_text=_RE_DETALHES)
 
             # Heuristic: click "Carregar mais" if exists (bounded), waiting for new cards.
+            btn = page.get_by_role("button", name=_RE_CARREGAR)
             for _ in range(6):
-                btn = page.get_by_role("button", name=re.compile(r"carregar|mais", re.IGNORECASE))
-                if btn.count() == 0:
+                if await btn.count() == 0:
                     break
                 try:
-                    prev_count = page.locator("a", has_text=re.compile(r"detalhes", re.IGNORECASE)).count()
-                    self.rate_limiter.wait()
-                    btn.first.click(timeout=1500)
-                    page.wait_for_load_state("networkidle", timeout=int(self.timeout_sec * 1000))
+                    prev_count = await details_links.count()
+                    await self.rate_limiter.wait_async()
+                    await btn.first.click(timeout=1500)
                     # Wait for new 'Detalhes' links to appear (best-effort)
-                    page.wait_for_function(
+                    await page.wait_for_function(
                         "(prev) => Array.from(document.querySelectorAll('a')).filter(a => (a.innerText||'').toLowerCase().includes('detalhes')).length > prev",
                         arg=max(0, prev_count),
                         timeout=3000,
@@ -186,14 +330,15 @@ class DetranLeilaoCrawler:
                     break
 
             # Parse via HTML so we can extract metadata from cards.
-            auctions = parse_auction_cards_from_home(page.content(), base_url=BASE_URL)
+            auctions = parse_auction_cards_from_home(await page.content(), base_url=BASE_URL)
 
             if max_auctions is not None:
                 auctions = auctions[:max_auctions]
 
-            context.close()
-            browser.close()
             return auctions
+        finally:
+            self.flush_network_log()
+            await context.close()
 
     def crawl_auction_lots(
         self,
@@ -206,28 +351,54 @@ class DetranLeilaoCrawler:
         This is Playwright-first because pagination is often client-rendered.
         Falls back to trying query-param pagination if possible.
         """
+        return self._run(self._crawl_auction_lots_async(auction, max_pages=max_pages, dry_run=dry_run))
+
+    def crawl_auctions_lots(
+        self,
+        auctions: list[Auction],
+        max_pages: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> list[list[Lot]]:
+        """Crawl lots of several auctions, up to `concurrency` at a time.
+
+        Returns one list of lots per auction, in the same order as `auctions`.
+        """
+        return self._run(
+            self._gather_bounded(
+                [self._crawl_auction_lots_async(a, max_pages=max_pages, dry_run=dry_run) for a in auctions]
+            )
+        )
+
+    async def _crawl_auction_lots_async(
+        self,
+        auction: Auction,
+        max_pages: Optional[int],
+        dry_run: bool,
+    ) -> list[Lot]:
         if not self._respect(auction.url):
             return []
 
         out_jsonl = self.output_dir / "raw" / auction.auction_id / "lots.jsonl"
-        existing = self._load_existing_lots(out_jsonl)
-        lots_all: list[Lot] = list(existing.values())
 
         try:
-            lots_all = self._crawl_auction_lots_playwright(
-                auction=auction,
-                out_jsonl=out_jsonl,
-                max_pages=max_pages,
-                dry_run=dry_run,
-            )
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Playwright lots crawl failed for %s (%s). Trying requests fallback.", auction.url, exc)
-            lots_all = self._crawl_auction_lots_requests_fallback(
-                auction=auction,
-                out_jsonl=out_jsonl,
-                max_pages=max_pages,
-                dry_run=dry_run,
-            )
+            try:
+                lots_all = await self._crawl_auction_lots_playwright(
+                    auction=auction,
+                    out_jsonl=out_jsonl,
+                    max_pages=max_pages,
+                    dry_run=dry_run,
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Playwright lots crawl failed for %s (%s). Trying requests fallback.", auction.url, exc)
+                lots_all = await self._crawl_auction_lots_requests_fallback(
+                    auction=auction,
+                    out_jsonl=out_jsonl,
+                    max_pages=max_pages,
+                    dry_run=dry_run,
+                )
+        finally:
+            # The auction is done; its written-lot map is not needed any more.
+            self._lots_written.pop(auction.auction_id, None)
 
         return lots_all
 
@@ -241,15 +412,13 @@ class DetranLeilaoCrawler:
 
         uniq: dict[str, Lot] = {}
         try:
-            with out_jsonl.open("r", encoding="utf-8") as f:
+            with out_jsonl.open("rb") as f:
                 for line in f:
                     line = line.strip()
                     if not line:
                         continue
                     try:
-                        import json as _json
-
-                        obj = _json.loads(line)
+                        obj = orjson.loads(line)
                         lot_d = obj.get("lot") if isinstance(obj, dict) else None
                         if isinstance(lot_d, dict):
                             lot = lot_from_dict(lot_d)
@@ -261,7 +430,45 @@ class DetranLeilaoCrawler:
 
         return uniq
 
-    def _crawl_auction_lots_requests_fallback(
+    def _written_lots(self, out_jsonl: Path, auction_id: str) -> dict[str, Lot]:
+        """Latest lot written per lot_id for this auction.
+
+        A resumed auction's JSONL is parsed once, on first use; fresh auctions start
+        empty and never read their own output.
+        """
+        written = self._lots_written.get(auction_id)
+        if written is None:
+            resumed = self.checkpoint.has_progress(auction_id)
+            written = self._load_existing_lots(out_jsonl) if resumed else {}
+            self._lots_written[auction_id] = written
+        return written
+
+    def _append_lots(
+        self,
+        out_jsonl: Path,
+        auction_id: str,
+        page: int,
+        lots: list[Lot],
+        source: Optional[str] = None,
+    ) -> None:
+        """Append lots that are new or changed since they were last written for this auction.
+
+        Unchanged re-sightings are skipped; a changed lot (e.g. updated bid or situation)
+        gets a new row, and the last row wins when the JSONL is read back.
+        """
+        written = self._written_lots(out_jsonl, auction_id)
+        rows: list[dict[str, Any]] = []
+        for l in lots:
+            if written.get(l.lot_id) == l:
+                continue
+            written[l.lot_id] = l
+            row: dict[str, Any] = {"page": page, "lot": lot_to_dict(l)}
+            if source is not None:
+                row["source"] = source
+            rows.append(row)
+        jsonl_append_many(out_jsonl, rows)
+
+    async def _crawl_auction_lots_requests_fallback(
         self,
         auction: Auction,
         out_jsonl: Path,
@@ -270,40 +477,47 @@ class DetranLeilaoCrawler:
     ) -> list[Lot]:
         # If already collected page 1, reuse existing data.
         if self.checkpoint.is_page_done(auction.auction_id, 1):
-            return list(self._load_existing_lots(out_jsonl).values())
+            return list(self._written_lots(out_jsonl, auction.auction_id).values())
 
         # Minimal fallback: fetch the details page once and attempt to parse visible cards.
         # If the site is JS-heavy, this will likely return few/no lots.
-        html = self._requests_get(auction.url)
+        html = await self._requests_get_async(auction.url)
         lots = parse_lot_cards_from_html(html, auction.auction_id, page_url=auction.url)
-        for l in lots:
-            jsonl_append(out_jsonl, {"page": 1, "lot": asdict(l)})
+        self._append_lots(out_jsonl, auction.auction_id, 1, lots)
         self.checkpoint.mark_page_done(auction.auction_id, 1)
         self.checkpoint.save()
         return lots
 
-    def _crawl_auction_lots_playwright(
+    async def _crawl_auction_lots_playwright(
         self,
         auction: Auction,
         out_jsonl: Path,
         max_pages: Optional[int],
         dry_run: bool,
     ) -> list[Lot]:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            context = browser.new_context(user_agent=self.user_agent)
-            page = context.new_page()
+        context = await self._new_context()
+        pending_bodies: list[asyncio.Future] = []
+        try:
+            page = await context.new_page()
 
             # Collect JSON traffic for this auction for JSON-first crawling.
-            json_traffic: list[dict[str, Any]] = []
-            self._attach_network_logger(page, collector=json_traffic, auction_id=auction.auction_id)
+            json_traffic: deque[dict[str, Any]] = deque(maxlen=_JSON_TRAFFIC_KEEP)
+            pending_bodies, on_response = self._attach_network_logger(
+                page, collector=json_traffic, auction_id=auction.auction_id
+            )
 
-            self.rate_limiter.wait()
-            page.goto(auction.url, wait_until="domcontentloaded", timeout=int(self.timeout_sec * 1000))
-            page.wait_for_load_state("networkidle", timeout=int(self.timeout_sec * 1000))
+            await self.rate_limiter.wait_async()
+            await page.goto(auction.url, wait_until="domcontentloaded", timeout=int(self.timeout_sec * 1000))
+            # Lot cards render from the listing XHR, so its response has been seen by now.
+            await self._wait_for_content(page, LOT_CARD_SELECTOR)
+            # Response bodies are read in the background; make sure they are in before choosing.
+            await asyncio.gather(*list(pending_bodies))
+            # The JSON candidates are complete; responses from the HTML pass below are
+            # neither collected nor logged.
+            page.remove_listener("response", on_response)
 
             # JSON-first attempt: if we observed a JSON endpoint that returns lots, paginate it.
-            api_lots = self._try_crawl_lots_via_json_api(
+            api_lots = await self._try_crawl_lots_via_json_api(
                 auction_id=auction.auction_id,
                 json_traffic=json_traffic,
                 context=context,
@@ -312,29 +526,32 @@ class DetranLeilaoCrawler:
                 dry_run=dry_run,
             )
             if api_lots:
-                context.close()
-                browser.close()
-                uniq: dict[str, Lot] = {l.lot_id: l for l in api_lots}
-                return list(uniq.values())
+                return api_lots
 
-            # Start with any previously collected lots (resume).
-            existing = self._load_existing_lots(out_jsonl)
+            # Resumed auctions return everything written so far, earlier runs included.
+            resumed = self.checkpoint.has_progress(auction.auction_id)
 
             # Navigate pages using pagination controls if present.
             # Heuristic: look for pagination buttons/links with numbers.
-            lots_all: list[Lot] = list(existing.values())
+            lots_all: list[Lot] = []
+            seen_ids: set[str] = set()
             current_page_num = 1
 
-            def extract_current_page_lots() -> list[Lot]:
-                html = page.content()
+            cards = page.locator(LOT_CARD_SELECTOR)
+
+            async def extract_current_page_lots() -> list[Lot]:
+                # Ship only the card markup over CDP; the full DOM is the fallback.
+                fragments = await cards.evaluate_all("els => els.map(e => e.outerHTML)")
+                if fragments:
+                    return parse_lot_cards_from_fragments(fragments, auction.auction_id, page_url=page.url)
+                html = await page.content()
                 return parse_lot_cards_from_html(html, auction.auction_id, page_url=page.url)
 
             # Always process page 1
             if not self.checkpoint.is_page_done(auction.auction_id, 1):
-                lots = extract_current_page_lots()
-                for l in lots:
-                    jsonl_append(out_jsonl, {"page": 1, "lot": asdict(l)})
-                lots_all.extend(lots)
+                lots = await extract_current_page_lots()
+                self._append_lots(out_jsonl, auction.auction_id, 1, lots)
+                _extend_unique(lots_all, seen_ids, lots)
                 self.checkpoint.mark_page_done(auction.auction_id, 1)
                 self.checkpoint.save()
 
@@ -356,21 +573,21 @@ class DetranLeilaoCrawler:
                 before_url = page.url
                 before_first_lot = None
                 try:
-                    current = extract_current_page_lots()
+                    current = await extract_current_page_lots()
                     before_first_lot = current[0].lot_id if current else None
                 except Exception:
                     before_first_lot = None
                 try:
                     locator = page.get_by_role("link", name=str(next_page_num))
-                    if locator.count() > 0:
-                        self.rate_limiter.wait()
-                        locator.first.click(timeout=2500)
+                    if await locator.count() > 0:
+                        await self.rate_limiter.wait_async()
+                        await locator.first.click(timeout=2500)
                         clicked = True
                     else:
                         btn = page.get_by_role("button", name=str(next_page_num))
-                        if btn.count() > 0:
-                            self.rate_limiter.wait()
-                            btn.first.click(timeout=2500)
+                        if await btn.count() > 0:
+                            await self.rate_limiter.wait_async()
+                            await btn.first.click(timeout=2500)
                             clicked = True
                 except Exception:
                     clicked = False
@@ -379,18 +596,18 @@ class DetranLeilaoCrawler:
                     # Try next arrow
                     try:
                         # 1. Try generic text-based "Next"
-                        nxt = page.get_by_role("link", name=re.compile(r"próx|next|>+", re.IGNORECASE))
-                        if nxt.count() > 0:
-                            self.rate_limiter.wait()
-                            nxt.first.click(timeout=2500)
+                        nxt = page.get_by_role("link", name=_RE_NEXT)
+                        if await nxt.count() > 0:
+                            await self.rate_limiter.wait_async()
+                            await nxt.first.click(timeout=2500)
                             clicked = True
                         else:
                             # 2. Try icon-based "Next" (common in Detran/Bootstrap)
                             # Looking for <i> inside an <a> that is NOT inside a .disabled li
                             arrow = page.locator("li.page-item:not(.disabled) a i.fa-chevron-right, li.page-item:not(.disabled) a i.fa-angle-right")
-                            if arrow.count() > 0:
-                                self.rate_limiter.wait()
-                                arrow.first.click(timeout=2500)
+                            if await arrow.count() > 0:
+                                await self.rate_limiter.wait_async()
+                                await arrow.first.click(timeout=2500)
                                 clicked = True
                     except Exception:
                         clicked = False
@@ -399,12 +616,11 @@ class DetranLeilaoCrawler:
                     break
 
                 # Wait for navigation/content change.
-                page.wait_for_load_state("networkidle", timeout=int(self.timeout_sec * 1000))
                 try:
                     if page.url != before_url:
-                        pass
+                        await self._wait_for_content(page, LOT_CARD_SELECTOR)
                     elif before_first_lot is not None:
-                        page.wait_for_function(
+                        await page.wait_for_function(
                             "(prevLotId) => { const txt = document.body ? document.body.innerText : ''; return !txt.includes(prevLotId); }",
                             arg=str(before_first_lot),
                             timeout=5000,
@@ -413,38 +629,55 @@ class DetranLeilaoCrawler:
                     # Best-effort; continue anyway.
                     pass
 
-                lots = extract_current_page_lots()
-                for l in lots:
-                    jsonl_append(out_jsonl, {"page": next_page_num, "lot": asdict(l)})
-                lots_all.extend(lots)
+                lots = await extract_current_page_lots()
+                self._append_lots(out_jsonl, auction.auction_id, next_page_num, lots)
+                _extend_unique(lots_all, seen_ids, lots)
 
                 self.checkpoint.mark_page_done(auction.auction_id, next_page_num)
                 self.checkpoint.save()
 
                 current_page_num = next_page_num
 
-            context.close()
-            browser.close()
+            if resumed:
+                # Seeded from the JSONL once and kept current by _append_lots above.
+                return list(self._written_lots(out_jsonl, auction.auction_id).values())
 
-            # De-dup by lot_id
-            uniq: dict[str, Lot] = {}
-            for l in lots_all:
-                uniq[l.lot_id] = l
-            return list(uniq.values())
+            return lots_all
+        finally:
+            # Body reads still in flight (e.g. the JSON attempt failed) must not outlive the context.
+            for task in pending_bodies:
+                task.cancel()
+            await asyncio.gather(*pending_bodies, return_exceptions=True)
+            self.flush_network_log()
+            await context.close()
 
     def _attach_network_logger(
         self,
         page: Page,
-        collector: Optional[list[dict[str, Any]]] = None,
+        collector: Optional[deque[dict[str, Any]]] = None,
         auction_id: Optional[str] = None,
-    ) -> None:
+    ) -> tuple[list[asyncio.Future], Callable[[Response], None]]:
+        """Log JSON responses seen by `page`.
+
+        With a `collector`, entries are appended in arrival order and their parsed
+        body is filled in by a background task; the returned list holds those tasks
+        so callers can await them before reading `collector`. The returned handler
+        can be passed to ``page.remove_listener("response", ...)`` to stop logging.
+        """
+        pending: list[asyncio.Future] = []
         network_log = self.output_dir / "network.jsonl"
         # Per-auction audit log (metadata only).
         per_auction_log = None
         if auction_id:
             per_auction_log = self.output_dir / "raw" / auction_id / "api_endpoints.jsonl"
 
-        def on_response(resp):
+        async def read_body(resp, entry: dict[str, Any]) -> None:
+            try:
+                entry["json"] = await resp.json()
+            except Exception:
+                entry["json"] = None
+
+        def on_response(resp: Response) -> None:
             try:
                 ct = resp.headers.get("content-type", "")
                 if "application/json" in ct:
@@ -463,40 +696,50 @@ class DetranLeilaoCrawler:
                     except Exception:
                         pass
 
-                    # Only parse JSON body for in-memory collector (to avoid persisting payloads on disk).
-                    body_obj = None
-                    if collector is not None:
-                        try:
-                            body_obj = resp.json()
-                            entry["json"] = body_obj
-                        except Exception:
-                            entry["json"] = None
-
-                    jsonl_append(
-                        network_log,
-                        {
-                            "url": resp.url,
-                            "status": resp.status,
-                            "content_type": ct,
-                        },
-                    )
-
+                    buf = self._network_buf
+                    buf.append((network_log, {"url": resp.url, "status": resp.status, "content_type": ct}))
                     if per_auction_log is not None:
-                        # Strip any parsed body before writing to disk
-                        entry_disk = {k: v for k, v in entry.items() if k != "json"}
-                        jsonl_append(per_auction_log, entry_disk)
-                    if collector is not None:
+                        # Copied before any parsed body is attached below.
+                        buf.append((per_auction_log, dict(entry)))
+                    if len(buf) >= _NETWORK_FLUSH_EVERY:
+                        self.flush_network_log()
+
+                    if collector is not None and self._wants_body(resp.url, resp.headers):
+                        # Only parse JSON body for in-memory collector (to avoid persisting payloads on disk).
+                        entry["json"] = None
                         collector.append(entry)
+                        pending.append(asyncio.ensure_future(read_body(resp, entry)))
             except Exception:
                 return
 
         page.on("response", on_response)
+        return pending, on_response
 
-    def _try_crawl_lots_via_json_api(
+    @staticmethod
+    def _wants_body(url: str, headers: dict[str, str]) -> bool:
+        if _SKIP_BODY_URLS.search(url):
+            return False
+        try:
+            return int(headers.get("content-length") or 0) <= _MAX_BODY_BYTES
+        except ValueError:
+            return True
+
+    def flush_network_log(self) -> None:
+        """Write buffered network audit entries, one append per log file."""
+        if not self._network_buf:
+            return
+        by_path: dict[Path, list[dict[str, Any]]] = {}
+        for path, entry in self._network_buf:
+            by_path.setdefault(path, []).append(entry)
+        self._network_buf = []
+        for path, entries in by_path.items():
+            jsonl_append_many(path, entries)
+
+    async def _try_crawl_lots_via_json_api(
         self,
         auction_id: str,
-        json_traffic: list[dict[str, Any]],
-        context,
+        json_traffic: deque[dict[str, Any]],
+        context: BrowserContext,
         out_jsonl: Path,
         max_pages: Optional[int],
         dry_run: bool,
@@ -512,25 +755,28 @@ class DetranLeilaoCrawler:
         # Select best candidate: JSON response whose body yields the most lots.
         best = None
         best_lots: list[Lot] = []
-        for e in json_traffic[-200:]:
+        # Key path of the lots list in the chosen endpoint's payload; later pages
+        # of that endpoint are probed there first.
+        best_path: Optional[tuple[str, ...]] = None
+        for e in json_traffic:
             body = e.get("json")
             if body is None:
                 continue
             try:
-                lots = extract_lots_from_json(body, auction_id=auction_id)
+                lots, path = find_lots_in_json(body, auction_id=auction_id)
             except Exception:
                 continue
             if len(lots) > len(best_lots):
                 best = e
                 best_lots = lots
+                best_path = path
 
         if best is None or not best_lots:
             return []
 
         # If page 1 already done, don't re-save, but still use this path for pagination.
         if not self.checkpoint.is_page_done(auction_id, 1):
-            for l in best_lots:
-                jsonl_append(out_jsonl, {"page": 1, "lot": asdict(l), "source": "api"})
+            self._append_lots(out_jsonl, auction_id, 1, best_lots, source="api")
             self.checkpoint.mark_page_done(auction_id, 1)
             self.checkpoint.save()
 
@@ -558,8 +804,13 @@ class DetranLeilaoCrawler:
         headers = best.get("request_headers") or {}
         post_data = best.get("post_data")
 
-        lots_all = list(best_lots)
+        lots_all: list[Lot] = []
+        seen_ids: set[str] = set()
+        _extend_unique(lots_all, seen_ids, best_lots)
 
+        # Plan the remaining pages up front; pages are independent, so they are
+        # fetched `concurrency` at a time and then processed in page order.
+        plan: list[tuple[int, str, Optional[str]]] = []
         for page_num in range(2, target_pages + 1):
             if max_pages is not None and page_num > max_pages:
                 break
@@ -578,43 +829,62 @@ class DetranLeilaoCrawler:
 
             if not self._respect(url):
                 break
+            plan.append((page_num, url, body_text))
 
-            self.rate_limiter.wait()
-            try:
-                if method == "GET":
-                    resp = context.request.get(url, headers={**headers, "User-Agent": self.user_agent}, timeout=self.timeout_sec * 1000)
-                else:
-                    resp = context.request.post(
-                        url,
-                        headers={**headers, "User-Agent": self.user_agent, "Content-Type": "application/json"},
-                        data=body_text or "{}",
-                        timeout=self.timeout_sec * 1000,
-                    )
-
-                if resp.status in (401, 403):
-                    logger.info("API requires login for auction %s (status=%s). Falling back to HTML.", auction_id, resp.status)
-                    return []
+        async def fetch(url: str, body_text: Optional[str]) -> tuple[int, Any]:
+            await self.rate_limiter.wait_async()
+            if method == "GET":
+                resp = await context.request.get(url, headers={**headers, "User-Agent": self.user_agent}, timeout=self.timeout_sec * 1000)
+            else:
+                resp = await context.request.post(
+                    url,
+                    headers={**headers, "User-Agent": self.user_agent, "Content-Type": "application/json"},
+                    data=body_text or "{}",
+                    timeout=self.timeout_sec * 1000,
+                )
+            if not resp.ok:
+                return resp.status, None
+            return resp.status, await resp.json()
+
+        for start in range(0, len(plan), self.concurrency):
+            batch = plan[start : start + self.concurrency]
+            results = await asyncio.gather(*(fetch(url, body) for _, url, body in batch), return_exceptions=True)
+
+            stop = False
+            for (page_num, _, _), result in zip(batch, results):
+                try:
+                    if isinstance(result, BaseException):
+                        raise result
+
+                    status, data = result
+                    if status in (401, 403):
+                        logger.info("API requires login for auction %s (status=%s). Falling back to HTML.", auction_id, status)
+                        # Earlier pages of this batch are already written; keep their marks.
+                        self.checkpoint.save()
+                        return []
+
+                    if data is None:
+                        logger.info("API page fetch failed auction=%s page=%s status=%s", auction_id, page_num, status)
+                        stop = True
+                        break
 
-                if not resp.ok:
-                    logger.info("API page fetch failed auction=%s page=%s status=%s", auction_id, page_num, resp.status)
+                    lots, _ = find_lots_in_json(data, auction_id=auction_id, key_path=best_path)
+                    if not lots:
+                        # If total pages unknown, stop when empty.
+                        if total_pages is None:
+                            stop = True
+                            break
+                    self._append_lots(out_jsonl, auction_id, page_num, lots, source="api")
+                    _extend_unique(lots_all, seen_ids, lots)
+
+                    self.checkpoint.mark_page_done(auction_id, page_num)
+                except Exception as exc:  # noqa: BLE001
+                    logger.info("API pagination error auction=%s page=%s (%s)", auction_id, page_num, exc)
+                    stop = True
                     break
 
-                data = resp.json()
-                lots = extract_lots_from_json(data, auction_id=auction_id)
-                if not lots:
-                    # If total pages unknown, stop when empty.
-                    if total_pages is None:
-                        break
-                for l in lots:
-                    jsonl_append(out_jsonl, {"page": page_num, "lot": asdict(l), "source": "api"})
-                lots_all.extend(lots)
-
-                self.checkpoint.mark_page_done(auction_id, page_num)
-                self.checkpoint.save()
-            except Exception as exc:  # noqa: BLE001
-                logger.info("API pagination error auction=%s page=%s (%s)", auction_id, page_num, exc)
+            self.checkpoint.save()
+            if stop:
                 break
 
-        # De-dup
-        uniq: dict[str, Lot] = {l.lot_id: l for l in lots_all}
-        return list(uniq.values())
+        return lots_all
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Any, Iterable, Optional
 
@@ -30,6 +31,17 @@ class FilterEngine:
     def __init__(self, cfg: FiltersConfig) -> None:
         self.cfg = cfg
 
+        # Normalize the config once; accept() runs per lot.
+        self._tipo = _norm(cfg.tipo_veiculo) if cfg.tipo_veiculo else None
+        self._allowed = frozenset(a for a in map(_norm, cfg.marcas_permitidas or []) if a)
+        self._kws_all = frozenset(k for k in map(_norm, cfg.descricao_keywords_all or []) if k)
+        # One scan collects every "all" keyword present; overlapping keywords the
+        # scan can miss are re-checked with `in` (see _has_all_keywords).
+        longest_first = sorted(self._kws_all, key=len, reverse=True)
+        self._all_re = re.compile("|".join(map(re.escape, longest_first))) if longest_first else None
+        kws_any = [k for k in map(_norm, cfg.descricao_keywords_any or []) if k]
+        self._any_re = re.compile("|".join(map(re.escape, kws_any))) if kws_any else None
+
     @staticmethod
     def from_dict(d: dict[str, Any]) -> "FilterEngine":
         cfg = FiltersConfig(
@@ -46,47 +58,58 @@ class FilterEngine:
         return FilterEngine(cfg)
 
     def accept(self, lot: Lot) -> bool:
-        if self.cfg.ignore_requires_login and lot.requires_login:
-            return False
+        # Cheap field checks first, so most rejects never touch the text.
+        return self._accept_fields(lot) and self._accept_text(lot)
 
-        desc = _norm(lot.description_short) + " " + _norm(lot.raw_text)
+    def accept_many(self, lots: Iterable[Lot]) -> list[Lot]:
+        """Filter a batch: one field-check sweep, then text checks on the survivors only."""
+        candidates = [l for l in lots if self._accept_fields(l)]
+        return [l for l in candidates if self._accept_text(l)]
 
-        if self.cfg.ignore_sucata and "sucata" in desc:
+    def _accept_fields(self, lot: Lot) -> bool:
+        cfg = self.cfg
+        if cfg.ignore_requires_login and lot.requires_login:
             return False
 
-        if self.cfg.tipo_veiculo:
-            tv = _norm(self.cfg.tipo_veiculo)
-            if tv == "moto" and "moto" not in desc:
-                return False
-            if tv == "carro" and any(k in desc for k in ["moto", "motocic"]):
+        if lot.year is not None:
+            if cfg.ano_min is not None and lot.year < cfg.ano_min:
                 return False
-
-        if self.cfg.marcas_permitidas:
-            allowed = {_norm(x) for x in self.cfg.marcas_permitidas if _norm(x)}
-            bm = _norm(lot.brand_model) + " " + _norm(lot.description_short)
-            if allowed and not any(a in bm for a in allowed):
+            if cfg.ano_max is not None and lot.year > cfg.ano_max:
                 return False
 
-        if self.cfg.ano_min is not None and lot.year is not None and lot.year < self.cfg.ano_min:
+        if cfg.valor_max is not None and lot.start_bid is not None and lot.start_bid > cfg.valor_max:
             return False
-        if self.cfg.ano_max is not None and lot.year is not None and lot.year > self.cfg.ano_max:
+
+        return True
+
+    def _has_all_keywords(self, desc: str) -> bool:
+        found = {m.group(0) for m in self._all_re.finditer(desc)}
+        return all(k in desc for k in self._kws_all - found)
+
+    def _accept_text(self, lot: Lot) -> bool:
+        desc = _norm(lot.description_short) + " " + _norm(lot.raw_text)
+
+        if self.cfg.ignore_sucata and "sucata" in desc:
             return False
 
-        if self.cfg.valor_max is not None and lot.start_bid is not None and lot.start_bid > self.cfg.valor_max:
+        if self._tipo == "moto" and "moto" not in desc:
+            return False
+        if self._tipo == "carro" and ("moto" in desc or "motocic" in desc):
             return False
 
-        if self.cfg.descricao_keywords_all:
-            kws = [_norm(k) for k in self.cfg.descricao_keywords_all if _norm(k)]
-            if any(k not in desc for k in kws):
+        if self._allowed:
+            bm = _norm(lot.brand_model) + " " + _norm(lot.description_short)
+            if not any(a in bm for a in self._allowed):
                 return False
 
-        if self.cfg.descricao_keywords_any:
-            kws = [_norm(k) for k in self.cfg.descricao_keywords_any if _norm(k)]
-            if kws and not any(k in desc for k in kws):
-                return False
+        if self._all_re is not None and not self._has_all_keywords(desc):
+            return False
+
+        if self._any_re is not None and self._any_re.search(desc) is None:
+            return False
 
         return True
 
 
 def filter_lots(lots: Iterable[Lot], engine: FilterEngine) -> list[Lot]:
-    return [l for l in lots if engine.accept(l)]
+    return engine.accept_many(lots)
@@ -1,48 +1,79 @@
 from __future__ import annotations
 
-import json
+import atexit
 import logging
+import queue
+import re
+from logging.handlers import QueueHandler, QueueListener
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
+
+import orjson
 
 
 def setup_logging(output_dir: Path, level: int = logging.INFO) -> None:
+    """Log to stderr and <output_dir>/crawler.log without blocking the caller.
+
+    Records are queued by a QueueHandler and written by a QueueListener thread,
+    so crawl code never waits on file I/O. Like logging.basicConfig, this is a
+    no-op when the root logger already has handlers.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
     log_file = output_dir / "crawler.log"
 
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s %(levelname)s %(name)s - %(message)s",
-        handlers=[logging.StreamHandler(), logging.FileHandler(log_file, encoding="utf-8")],
-    )
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s - %(message)s")
+    handlers: list[logging.Handler] = [logging.StreamHandler(), logging.FileHandler(log_file, encoding="utf-8")]
+    for h in handlers:
+        h.setFormatter(formatter)
+
+    q: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(q, *handlers, respect_handler_level=True)
+    listener.start()
+    # Drains pending records and closes the file on interpreter exit.
+    atexit.register(listener.stop)
+
+    root.setLevel(level)
+    root.addHandler(QueueHandler(q))
+
+
+_JSONL_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+# Currency symbol, whitespace (incl. NBSP) and thousands separators in "R$ 1.234,56".
+_MONEY_STRIP = re.compile(r"R\$|[\s.]")
+
+
+def _json_default(o: Any) -> Any:
+    if is_dataclass(o):
+        return asdict(o)
+    if isinstance(o, datetime):
+        return o.isoformat()
+    return str(o)
 
 
 def jsonl_append(path: Path, obj: Any) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+    jsonl_append_many(path, [obj])
 
-    def _default(o: Any) -> Any:
-        if is_dataclass(o):
-            return asdict(o)
-        if isinstance(o, datetime):
-            return o.isoformat()
-        return str(o)
 
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(obj, ensure_ascii=False, default=_default) + "\n")
+def jsonl_append_many(path: Path, objs: Iterable[Any]) -> None:
+    """Append several JSON lines with a single open/write."""
+    lines = [orjson.dumps(o, default=_json_default, option=_JSONL_OPTIONS) for o in objs]
+    if not lines:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("ab") as f:
+        f.write(b"".join(lines))
 
 
 def safe_float(text: Optional[str]) -> Optional[float]:
     if not text:
         return None
-    t = (
-        text.replace("R$", "")
-        .replace(" ", "")
-        .replace(".", "")
-        .replace(",", ".")
-        .strip()
-    )
+    t = _MONEY_STRIP.sub("", text).replace(",", ".")
     try:
         return float(t)
     except ValueError:
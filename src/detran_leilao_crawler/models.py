@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Optional, Sequence
+from typing import Any, Optional, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Auction:
     auction_id: str
     url: str
@@ -17,14 +17,14 @@ class Auction:
     ends_at: Optional[datetime] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LotImage:
     auction_id: str
     lot_id: str
     url: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Lot:
     auction_id: str
     lot_id: str
@@ -42,3 +42,11 @@ class Lot:
     requires_login: bool = False
 
     raw_text: Optional[str] = None
+
+
+LOT_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(Lot))
+
+
+def lot_to_dict(lot: Lot) -> dict[str, Any]:
+    """Flat field dict of a Lot; ``asdict`` without its recursive deep copy."""
+    return {name: getattr(lot, name) for name in LOT_FIELDS}
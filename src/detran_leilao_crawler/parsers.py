@@ -3,16 +3,194 @@ from __future__ import annotations
 import re
 import urllib.parse
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional, Sequence
 
-from bs4 import BeautifulSoup
+import lxml.html
 from dateutil import parser as dateparser
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
 
 from .logging_utils import safe_float
 from .models import Auction, Lot
 
 
+# Portuguese accents folded to ASCII, one char for one char so match offsets in
+# the folded text are valid in the original. Lets patterns spell labels plainly.
+_ACCENT_TABLE = str.maketrans(
+    "áàâãäéèêëíìîïóòôõöúùûüçÁÀÂÃÄÉÈÊËÍÌÎÏÓÒÔÕÖÚÙÛÜÇ",
+    "aaaaaeeeeiiiiooooouuuucAAAAAEEEEIIIIOOOOOUUUUC",
+)
+
 _WS = re.compile(r"\s+")
+_NON_WORD = re.compile(r"\W+")
+_YEAR_RE = re.compile(r"\b(19\d{2}|20\d{2})\b")
+# Whitespace and digit runs below are possessive (*+, ++) where giving characters
+# back can never produce a different match; a failed attempt then fails at once
+# instead of retrying every split of the run.
+_TRAILING_YEAR_RE = re.compile(r"(?<!\s)\s*+\b(19\d{2}|20\d{2})\b\s*+$")
+_AUCTION_NUMBER_RE = re.compile(
+    r"\b(leilao)\s*+(n[ºo]\.?|n\b|n\s*o)?\s*+[:\-]?\s*+([0-9]{1,10}+(?:\/[0-9]{2,4})?)\b", re.IGNORECASE
+)
+_CITY_SUFFIX_RE = re.compile(r"-\s*+([^0-9\-]++)$")
+_YARD_RE = re.compile(r"(patio)\s*+[:\-]?\s*+(.*)", re.IGNORECASE)
+_YARD_FALLBACK_RE = re.compile(
+    r"\b(patio)\b\s*+[:\-]?\s*+([^\n\r]+?)(?=\s{2,}|\bDocumentos\b|\bLote\b|$)", re.IGNORECASE
+)
+_END_RE = re.compile(r"\b(encerramento|encerra)\b\s*+[:\-]?\s*+(.+)$", re.IGNORECASE)
+_LOTE_WORD_RE = re.compile(r"\blote\b", re.IGNORECASE)
+_LOTE_NUM_RE = re.compile(r"\bLote\s*+([0-9]++[a-zA-Z0-9\-\.]*)\b", re.IGNORECASE)
+_LOTE_ID_FALLBACK_RE = re.compile(r"\bLote\s*+[:#-]?\s*+([0-9]++[a-zA-Z0-9\-\.]*)\b", re.IGNORECASE)
+_MONEY_RE = re.compile(r"R\$\s*+[0-9\.,]+")
+_ENCERR_RE = re.compile(r"encerr", re.IGNORECASE)
+_LOT_DETAILS_PATH_RE = re.compile(r"/lotes/detalhes/\d+")
+# References urljoin would rewrite beyond plain concatenation: dot segments,
+# empty params/query/fragment markers that urlunparse drops, or the tab/CR/LF
+# characters urlsplit strips.
+_URLJOIN_REWRITES_RE = re.compile(r"/\.|[;?#]$|[;?]#|;\?|[\t\r\n]")
+
+# Labels for "key: value" lookups (matched against _ascii text), compiled once per label.
+_CITY_KEYS = ("cidade", "municipio", "local")
+_YARD_KEYS = ("patio",)
+_ORGANIZER_KEYS = ("organizador", "leiloeiro")
+_KV_RES: dict[str, re.Pattern[str]] = {}
+
+# Closing date/time labels on the auction details page, in priority order. One
+# alternation finds every label; the value is then matched from the label's end.
+_ENDS_AT_LABELS = ("encerramento", "encerra", "data/hora", "data e hora", "termino")
+_ENDS_AT_LABEL_RE = re.compile(
+    r"\b(?:" + "|".join(f"({re.escape(label)})" for label in _ENDS_AT_LABELS) + r")\b", re.IGNORECASE
+)
+_ENDS_AT_VALUE_RE = re.compile(r"\s*+[:\-]?\s*+(.+?)($|\s{2,})")
+
+# Keyword lists (ASCII, lowercase) in priority order (first listed wins), each
+# scanned with one alternation regex; see _first_keyword.
+_STATUS_KEYWORDS = ("publicado", "aberto", "encerrado", "finalizado", "em andamento")
+_SITUATION_KEYWORDS = ("sem reserva", "com reserva", "sucata", "recuperavel", "circula", "nao circula")
+
+_STATUS_RE = re.compile("|".join(f"({re.escape(k)})" for k in _STATUS_KEYWORDS))
+_SITUATION_RE = re.compile("|".join(f"({re.escape(k)})" for k in _SITUATION_KEYWORDS))
+
+
+def _ascii(s: str) -> str:
+    return s.translate(_ACCENT_TABLE)
+
+
+def _first_keyword(pattern: re.Pattern[str], text: str) -> Optional[str]:
+    """Return the highest-priority keyword found in lowercase `text`, in a single scan.
+
+    `pattern` is an alternation with one group per keyword, in priority order. It
+    runs over the accent-folded text; the match is returned as written in `text`.
+
+    Matches do not overlap, so a keyword inside a longer one that matched first is
+    never reported, whatever its priority: for "nao circula" the result is "nao
+    circula" even though "circula" is listed earlier. List order only decides
+    between keywords found at separate places in the text.
+    """
+    best: Optional[re.Match[str]] = None
+    for m in pattern.finditer(_ascii(text)):
+        if best is None or m.lastindex < best.lastindex:
+            best = m
+            if best.lastindex == 1:
+                break
+    return text[best.start() : best.end()] if best is not None else None
+
+
+def _kv_pattern(key: str) -> re.Pattern[str]:
+    pat = _KV_RES.get(key)
+    if pat is None:
+        pat = re.compile(rf"\b{key}\b\s*+[:\-]?\s*+(.+?)($|\s{{2,}}|\b[A-Z][a-z]++\b\s*+[:\-])", re.IGNORECASE)
+        _KV_RES[key] = pat
+    return pat
+
+
+for _key in (*_CITY_KEYS, *_YARD_KEYS, *_ORGANIZER_KEYS):
+    _kv_pattern(_key)
+
+# Lot cards in the site's current markup. The crawler also uses it to pull just
+# the cards out of the live DOM (see parse_lot_cards_from_fragments).
+LOT_CARD_SELECTOR = "div.card.listaLotes, div.card[id]"
+
+
+# Text nodes as BeautifulSoup's get_text() saw them: comments, scripts and styles excluded.
+_TEXT_NODES = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+    smart_strings=False,
+)
+
+
+# Fixed selectors, translated to XPath once at import.
+_SEL_LOT_CARDS = CSSSelector(LOT_CARD_SELECTOR)
+_SEL_HEADER_B = CSSSelector("div.card-body b")
+_SEL_HEADER_SPANS = CSSSelector("div.card-body b span")
+_SEL_BRAND_MODEL = CSSSelector("div.row div.col-12.text-center b")
+_SEL_CLICKABLE = CSSSelector("span[onclick]")
+_SEL_IMG = CSSSelector("img")
+_SEL_A = CSSSelector("a")
+# Fallback candidates: div/article whose string value mentions "lote" (ASCII
+# case-folded), filtered inside libxml2. string() also counts script/style text,
+# so the Python-side text check still has the final say.
+_XP_FALLBACK_CARDS = etree.XPath(
+    ".//*[self::div or self::article][contains(translate(., 'LOTE', 'lote'), 'lote')]"
+)
+_SEL_MAIN_H4 = CSSSelector("main h4")
+_SEL_H4 = CSSSelector("h4")
+_SEL_H6 = CSSSelector("h6")
+_BID_ID_PREFIX = "valor_atual_lote_"
+# Block elements whose text describes a home-page auction card. If none is found
+# within this many levels above the "Detalhes" link, the ancestor at that level
+# is used as is; a shorter chain falls back to the root element.
+_HOME_BLOCK_TAGS = frozenset({"div", "article", "section", "li"})
+_HOME_BLOCK_MAX_DEPTH = 4
+_XP_BID_ELS = etree.XPath(f".//*[starts-with(@id, '{_BID_ID_PREFIX}')]")
+
+
+def _parse_html(html: str) -> Optional[HtmlElement]:
+    if not html or not html.strip():
+        return None
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # str input carrying an XML encoding declaration
+        return lxml.html.document_fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        return None
+
+
+def _text(el: HtmlElement, sep: str = " ") -> str:
+    return sep.join(_TEXT_NODES(el))
+
+
+def _url_joiner(base: str) -> Callable[[str], str]:
+    """``urljoin(base, ref)`` that skips re-parsing ``base`` for root-relative refs."""
+    parts = urllib.parse.urlsplit(base)
+    origin = f"{parts.scheme}://{parts.netloc}" if parts.scheme and parts.netloc else None
+
+    def join(ref: str) -> str:
+        if origin and ref[:1] == "/" and ref[1:2] != "/" and not _URLJOIN_REWRITES_RE.search(ref):
+            return origin + ref
+        return urllib.parse.urljoin(base, ref)
+
+    return join
+
+
+def _text_reader() -> Callable[[HtmlElement], str]:
+    """Normalized element text, memoized per element for the lifetime of one page."""
+    cache: dict[HtmlElement, str] = {}
+
+    def read(el: HtmlElement) -> str:
+        text = cache.get(el)
+        if text is None:
+            text = cache[el] = norm_text(_text(el))
+        return text
+
+    return read
+
+
+def _first(el: HtmlElement, selector: CSSSelector) -> Optional[HtmlElement]:
+    found = selector(el)
+    return found[0] if found else None
 
 
 def norm_text(s: str) -> str:
@@ -22,7 +200,7 @@ def norm_text(s: str) -> str:
 def parse_year(text: str) -> Optional[int]:
     if not text:
         return None
-    m = re.search(r"\b(19\d{2}|20\d{2})\b", text)
+    m = _YEAR_RE.search(text)
     if not m:
         return None
     try:
@@ -31,27 +209,44 @@ def parse_year(text: str) -> Optional[int]:
         return None
 
 
-def parse_datetime_loose(text: str) -> Optional[datetime]:
-    if not text:
-        return None
+# Longer inputs are almost never repeated and would only bloat the cache.
+_DATETIME_CACHE_MAX_LEN = 200
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime_cached(text: str) -> Optional[datetime]:
+    return _parse_datetime(text)
+
+
+def _parse_datetime(text: str) -> Optional[datetime]:
     try:
         return dateparser.parse(text, dayfirst=True, fuzzy=True)
     except Exception:  # noqa: BLE001
         return None
 
 
-def _extract_kv(text: str, keys: list[str]) -> Optional[str]:
+def parse_datetime_loose(text: str) -> Optional[datetime]:
+    if not text:
+        return None
+    # Cards of one auction repeat the same closing date; fuzzy parsing is slow.
+    if len(text) < _DATETIME_CACHE_MAX_LEN:
+        return _parse_datetime_cached(text)
+    return _parse_datetime(text)
+
+
+def _extract_kv(text: str, keys: Sequence[str]) -> Optional[str]:
     t = norm_text(text)
+    folded = _ascii(t)
     for k in keys:
-        m = re.search(rf"\b{k}\b\s*[:\-]?\s*(.+?)($|\s{2,}|\b[A-Z][a-z]+\b\s*[:\-])", t, re.IGNORECASE)
+        m = _kv_pattern(k).search(folded)
         if m:
-            return norm_text(m.group(1))
+            return norm_text(t[m.start(1) : m.end(1)])
     return None
 
 
 def _guess_auction_number(text: str) -> Optional[str]:
     t = norm_text(text)
-    m = re.search(r"\b(leil[aã]o)\s*(n[ºo]\.?|n\b|n\s*o)?\s*[:\-]?\s*([0-9]{1,10}(?:\/[0-9]{2,4})?)\b", t, re.IGNORECASE)
+    m = _AUCTION_NUMBER_RE.search(_ascii(t))
     if m:
         return m.group(3)
     return None
@@ -59,9 +254,20 @@ def _guess_auction_number(text: str) -> Optional[str]:
 
 def _guess_status(text: str) -> Optional[str]:
     t = norm_text(text).lower()
-    for k in ["publicado", "aberto", "encerrado", "finalizado", "em andamento"]:
-        if k in t:
-            return k
+    return _first_keyword(_STATUS_RE, t)
+
+
+def _find_ends_at(text: str, folded: str) -> Optional[datetime]:
+    """First parseable closing date after a label, trying labels in priority order."""
+    label_ends: dict[int, int] = {}
+    for m in _ENDS_AT_LABEL_RE.finditer(folded):
+        label_ends.setdefault(m.lastindex, m.end())
+    for idx in sorted(label_ends):
+        m = _ENDS_AT_VALUE_RE.match(folded, label_ends[idx])
+        if m:
+            ends_at = parse_datetime_loose(text[m.start(1) : m.end(1)])
+            if ends_at:
+                return ends_at
     return None
 
 
@@ -70,17 +276,12 @@ def parse_auction_details_from_html(html: str, auction: Auction) -> Auction:
 
     This function is defensive by design; the site may change markup.
     """
-    soup = BeautifulSoup(html, "lxml")
-
-    # Limit the scope for metadata extraction to avoid bleeding into lots list.
-    # The header is usually in the first few rows or strictly before the first 'card'.
-    header_scope = soup
-    first_card = soup.select_one("div.card.listaLotes")
-    if first_card:
-        # Create a new soup from just the HTML before the first card, if possible.
-        # But determining "before" in DOM soup is tricky.
-        # Instead, we prefer specific selectors found in the header.
-        pass
+    doc = _parse_html(html)
+    if doc is None:
+        return auction
+
+    # Metadata comes from header selectors first (h4/h6) so it does not bleed
+    # into the lots list further down the page.
 
     # 1. Try structured selectors (h4, h6 in the main container)
     number = auction.number
@@ -89,26 +290,28 @@ def parse_auction_details_from_html(html: str, auction: Auction) -> Auction:
     status = auction.status
 
     # Header usually contains "Leilão NNN - CITY"
-    h4 = soup.select_one("main h4") or soup.select_one("h4")
-    if h4:
-        h4_text = norm_text(h4.get_text(" "))
+    h4 = _first(doc, _SEL_MAIN_H4)
+    if h4 is None:
+        h4 = _first(doc, _SEL_H4)
+    if h4 is not None:
+        h4_text = norm_text(_text(h4))
         if not number:
             number = _guess_auction_number(h4_text)
         if not city:
             # Often "Leilão 123 - CITYNAME"
-            m_city = re.search(r"-\s*([^0-9\-]+)$", h4_text)
+            m_city = _CITY_SUFFIX_RE.search(h4_text)
             if m_city:
                 city = norm_text(m_city.group(1))
 
     # Yard often in h6: "Patio: ..."
-    h6_list = soup.select("h6")
-    for h6 in h6_list:
-        t = norm_text(h6.get_text(" "))
-        if "patio" in t.lower() or "pátio" in t.lower():
+    for h6 in _SEL_H6(doc):
+        t = norm_text(_text(h6))
+        t_ascii = _ascii(t)
+        if "patio" in t_ascii.lower():
             # Extract value after colon if present
-            m_yard = re.search(r"(patio|pátio)\s*[:\-]?\s*(.*)", t, re.IGNORECASE)
+            m_yard = _YARD_RE.search(t_ascii)
             if m_yard:
-                candidate = m_yard.group(2).strip()
+                candidate = t[m_yard.start(2) : m_yard.end(2)].strip()
                 if candidate:
                     yard = candidate
             break
@@ -116,7 +319,8 @@ def parse_auction_details_from_html(html: str, auction: Auction) -> Auction:
     # 2. Fallback: Text-based extraction on a restricted block
     # We try to get text only from 'main' but exclude 'div.listaLotes' contents.
     # A simple heuristic is to grab text from the top of the body until we hit "Lote".
-    full_text = norm_text(soup.get_text(" "))
+    full_text = norm_text(_text(doc))
+    full_ascii = _ascii(full_text)
     
     # Heuristic: Truncate text at first occurrence of "Lote 1" or "Lote 0" or similar to avoid pollution
     # But be careful not to truncate "Lote" appearing in the address.
@@ -126,28 +330,22 @@ def parse_auction_details_from_html(html: str, auction: Auction) -> Auction:
         number = _guess_auction_number(full_text)
     
     if not city:
-        city = _extract_kv(full_text, ["cidade", "munic[ií]pio", "local"])
+        city = _extract_kv(full_text, _CITY_KEYS)
     
     if not yard:
         # If h6 didn't work, try strict regex on full text, but ensure we don't grab too much.
         # We enforce a stricter regex for Yard that doesn't allow newlines/long gaps.
         # The original _extract_kv is too greedy for this specific site structure.
-        m_yard_fallback = re.search(r"\b(p[aá]tio)\b\s*[:\-]?\s*([^\n\r]+?)(?=\s{2,}|\bDocumentos\b|\bLote\b|$)", full_text, re.IGNORECASE)
+        m_yard_fallback = _YARD_FALLBACK_RE.search(full_ascii)
         if m_yard_fallback:
-             yard = norm_text(m_yard_fallback.group(2))
+             yard = norm_text(full_text[m_yard_fallback.start(2) : m_yard_fallback.end(2)])
 
-    organizer = auction.organizer or _extract_kv(full_text, ["organizador", "leiloeiro"])  # best-effort
+    organizer = auction.organizer or _extract_kv(full_text, _ORGANIZER_KEYS)  # best-effort
     status = auction.status or _guess_status(full_text)
 
     ends_at = auction.ends_at
     if ends_at is None:
-        # Common labels for closing date/time
-        for label in ["encerramento", "encerra", "data/hora", "data e hora", "t[ée]rmino", "termino"]:
-            m = re.search(rf"\b{label}\b\s*[:\-]?\s*(.+?)($|\s{2,})", full_text, re.IGNORECASE)
-            if m:
-                ends_at = parse_datetime_loose(m.group(1))
-                if ends_at:
-                    break
+        ends_at = _find_ends_at(full_text, full_ascii)
 
     return Auction(
         auction_id=auction.auction_id,
@@ -166,35 +364,41 @@ def parse_auction_cards_from_home(html: str, base_url: str) -> list[Auction]:
 
     This is intentionally defensive; selectors may change. Playwright is preferred.
     """
-    soup = BeautifulSoup(html, "lxml")
+    doc = _parse_html(html)
+    if doc is None:
+        return []
+    # Several links can share one container; its text is read once.
+    txt = _text_reader()
     auctions: list[Auction] = []
 
     # Heuristic: links/buttons containing 'Detalhes'
-    for a in soup.select("a"):
-        label = norm_text(a.get_text(" "))
+    for a in _SEL_A(doc):
+        label = txt(a)
         if "detalhes" not in label.lower():
             continue
         href = a.get("href")
         if not href:
             continue
         url = href if href.startswith("http") else base_url.rstrip("/") + "/" + href.lstrip("/")
-        auction_id = re.sub(r"\W+", "-", url).strip("-").lower()
+        auction_id = _NON_WORD.sub("-", url).strip("-").lower()
 
         # Try to extract metadata from the closest container text.
-        container = a
-        for _ in range(4):
-            if container and getattr(container, "name", None) in {"div", "article", "section", "li"}:
+        # A shallow link with no block ancestor ends the walk at the root, so the
+        # whole page is used as its block.
+        container = None
+        for depth, anc in enumerate(a.iterancestors(), 1):
+            container = anc
+            if anc.tag in _HOME_BLOCK_TAGS or depth == _HOME_BLOCK_MAX_DEPTH:
                 break
-            container = container.parent
-        block_text = norm_text(container.get_text(" ")) if container else ""
+        block_text = txt(container) if container is not None else ""
 
         number = _guess_auction_number(block_text)
-        city = _extract_kv(block_text, ["cidade", "munic[ií]pio", "local"])  # best-effort
-        yard = _extract_kv(block_text, ["p[aá]tio", "patio"])  # best-effort
-        organizer = _extract_kv(block_text, ["organizador", "leiloeiro"])  # best-effort
+        city = _extract_kv(block_text, _CITY_KEYS)  # best-effort
+        yard = _extract_kv(block_text, _YARD_KEYS)  # best-effort
+        organizer = _extract_kv(block_text, _ORGANIZER_KEYS)  # best-effort
         status = _guess_status(block_text)
         ends_at = None
-        m_end = re.search(r"\b(encerramento|encerra)\b\s*[:\-]?\s*(.+)$", block_text, re.IGNORECASE)
+        m_end = _END_RE.search(block_text)
         if m_end:
             ends_at = parse_datetime_loose(m_end.group(2))
 
@@ -211,11 +415,18 @@ def parse_auction_cards_from_home(html: str, base_url: str) -> list[Auction]:
             )
         )
 
-    # De-dup by url
-    uniq: dict[str, Auction] = {}
-    for x in auctions:
-        uniq[x.url] = x
-    return list(uniq.values())
+    # De-dup by url (last wins)
+    return list({x.url: x for x in auctions}.values())
+
+
+def parse_lot_cards_from_fragments(fragments: list[str], auction_id: str, page_url: str) -> list[Lot]:
+    """Parse lots from the outerHTML of individual card elements (LOT_CARD_SELECTOR matches).
+
+    Avoids serializing and re-parsing the whole page when only the cards matter.
+    """
+    if not fragments:
+        return []
+    return parse_lot_cards_from_html("".join(fragments), auction_id, page_url=page_url)
 
 
 def parse_lot_cards_from_html(html: str, auction_id: str, page_url: str) -> list[Lot]:
@@ -223,220 +434,216 @@ def parse_lot_cards_from_html(html: str, auction_id: str, page_url: str) -> list
 
     Requires stable site markup to be effective; Playwright + JSON endpoints preferred.
     """
-    soup = BeautifulSoup(html, "lxml")
+    doc = _parse_html(html)
+    if doc is None:
+        return []
+
+    # Prefer the known structure for this site.
+    # De-dup by element identity (in case an element matches both selectors)
+    site_cards = list(dict.fromkeys(_SEL_LOT_CARDS(doc)))
+    if site_cards:
+        # One walk for every bid element instead of an id lookup per card.
+        bid_by_id = {el.get("id")[len(_BID_ID_PREFIX) :]: el for el in _XP_BID_ELS(doc)}
+        return _parse_site_cards(site_cards, bid_by_id, auction_id, page_url)
+
+    # Fallback: heuristic scanning if the expected structure isn't found.
+    return _parse_fallback_cards(doc, auction_id, page_url)
+
+
+def _parse_site_cards(
+    site_cards: list[HtmlElement], bid_by_id: dict[str, HtmlElement], auction_id: str, base: str
+) -> list[Lot]:
+    join = _url_joiner(base)
+    txt = _text_reader()
     lots: list[Lot] = []
+    for card in site_cards:
+        card_text = txt(card)
+        card_id = (card.get("id") or "").strip()
+        lot_id = card_id if card_id else None
+
+        # Visible header: "Lote 1 - CONSERVADO"
+        header_b = _first(card, _SEL_HEADER_B)
+        header_text = txt(header_b) if header_b is not None else None
+
+        # Extract lot number if needed (not stored separately yet)
+        m_lote_num = _LOTE_NUM_RE.search(header_text or card_text)
+
+        # Situation is usually the second span in header line.
+        situation = None
+        spans = _SEL_HEADER_SPANS(card)
+        if spans:
+            # expected: ["Lote 1", "CONSERVADO"]
+            if len(spans) >= 2:
+                situation = txt(spans[1]) or None
+        if not situation:
+            # fallback: common labels
+            t_low = card_text.lower()
+            situation = _first_keyword(_SITUATION_RE, t_low)
+
+        # Brand/model line is in the centered 40px row: <b>HONDA/CBX 250 TWISTER 2006</b>
+        brand_model_full = None
+        bm_el = None
+        for candidate in _SEL_BRAND_MODEL(card):
+            t = txt(candidate)
+            if not t:
+                continue
+            # Ignore the header that contains "Lote"
+            if _LOTE_WORD_RE.search(t):
+                continue
+            bm_el = candidate
+            brand_model_full = t
+            break
+
+        year = parse_year(brand_model_full or "") or parse_year(card_text)
+
+        brand_model = None
+        if brand_model_full:
+            # If year is the last token, strip it from brand_model.
+            m_year = _TRAILING_YEAR_RE.search(brand_model_full) if year is not None else None
+            if m_year and int(m_year.group(1)) == year:
+                brand_model = brand_model_full[: m_year.start()].strip() or brand_model_full
+            else:
+                brand_model = brand_model_full
+
+        # Start bid: <p id="valor_atual_lote_<id>">R$ 400,00</p>
+        start_bid = None
+        if lot_id:
+            bid_el = bid_by_id.get(lot_id)
+            if bid_el is not None:
+                start_bid = safe_float(txt(bid_el))
+        if start_bid is None:
+            m2 = _MONEY_RE.search(card_text)
+            if m2:
+                start_bid = safe_float(m2.group(0))
+
+        # Images
+        imgs: list[str] = []
+        for img in _SEL_IMG(card):
+            src = (img.get("src") or "").strip()
+            if not src:
+                continue
+            imgs.append(join(src))
+
+        # Determine lot details URL from onclick (preferred)
+        lot_url = None
+        onclick = None
+        clickable = _first(card, _SEL_CLICKABLE)
+        if clickable is not None:
+            onclick = clickable.get("onclick")
+        if onclick:
+            m = _LOT_DETAILS_PATH_RE.search(onclick)
+            if m:
+                lot_url = join(m.group(0))
+
+        # Requires login: explicit button/link
+        requires_login = False
+        for a in _SEL_A(card):
+            label = txt(a).lower()
+            href = (a.get("href") or "").lower()
+            if "login obrigat" in label or "/ssc/login/login" in href:
+                requires_login = True
+                break
+
+        # Fallback lot id using "Lote N" if card id missing
+        if not lot_id and m_lote_num:
+            lot_id = m_lote_num.group(1)
+        if not lot_id:
+            lot_id = _NON_WORD.sub("-", (header_text or card_text)[:60]).strip("-").lower() or "unknown"
+
+        description_short = header_text or (f"Lote {m_lote_num.group(1)}" if m_lote_num else None) or card_text
+
+        lots.append(
+            Lot(
+                auction_id=auction_id,
+                lot_id=str(lot_id),
+                description_short=description_short[:180],
+                brand_model=brand_model,
+                year=year,
+                situation=situation,
+                start_bid=start_bid,
+                ends_at=None,
+                lot_url=lot_url,
+                image_urls=tuple(imgs),
+                requires_login=requires_login,
+                raw_text=card_text,
+            )
+        )
+
+    return list({l.lot_id: l for l in lots}.values())
 
-    # Heuristic: cards with images + some text including 'Lote'
-    cards = soup.select("div, article")
+
+def _parse_fallback_cards(doc: HtmlElement, auction_id: str, base: str) -> list[Lot]:
+    """Heuristic scan: any div/article whose text mentions 'Lote'."""
+    join = _url_joiner(base)
+    txt = _text_reader()
+    lots: list[Lot] = []
+    cards = _XP_FALLBACK_CARDS(doc)
     for card in cards:
-        text = norm_text(card.get_text(" "))
+        text = txt(card)
         if not text or "lote" not in text.lower():
             continue
 
         requires_login = "login" in text.lower() and "obrig" in text.lower()
 
-        soup = BeautifulSoup(html, "lxml")
-        lots: list[Lot] = []
-
-        # Prefer the known structure for this site.
-        base = page_url
-        site_cards = soup.select("div.card.listaLotes, div.card[id]")
-        # De-dup by element identity (in case an element matches both selectors)
-        site_cards = list(dict.fromkeys(site_cards))
-
-        if site_cards:
-            for card in site_cards:
-                card_text = norm_text(card.get_text(" "))
-                card_id = (card.get("id") or "").strip()
-                lot_id = card_id if card_id else None
-
-                # Visible header: "Lote 1 - CONSERVADO"
-                header_b = card.select_one("div.card-body b")
-                header_text = norm_text(header_b.get_text(" ")) if header_b else None
-
-                # Extract lot number if needed (not stored separately yet)
-                m_lote_num = re.search(r"\bLote\s*([0-9]+[a-zA-Z0-9\-\.]*)\b", header_text or card_text, re.IGNORECASE)
-
-                # Situation is usually the second span in header line.
-                situation = None
-                spans = card.select("div.card-body b span")
-                if spans:
-                    # expected: ["Lote 1", "CONSERVADO"]
-                    if len(spans) >= 2:
-                        situation = norm_text(spans[1].get_text(" ")) or None
-                if not situation:
-                    # fallback: common labels
-                    t_low = card_text.lower()
-                    for k in ["sem reserva", "com reserva", "sucata", "recuperável", "recuperavel", "circula", "não circula", "nao circula"]:
-                        if k in t_low:
-                            situation = k
-                            break
-
-                # Brand/model line is in the centered 40px row: <b>HONDA/CBX 250 TWISTER 2006</b>
-                brand_model_full = None
-                bm_el = None
-                for candidate in card.select("div.row div.col-12.text-center b"):
-                    t = norm_text(candidate.get_text(" "))
-                    if not t:
-                        continue
-                    # Ignore the header that contains "Lote"
-                    if re.search(r"\blote\b", t, re.IGNORECASE):
-                        continue
-                    bm_el = candidate
-                    brand_model_full = t
-                    break
-
-                year = parse_year(brand_model_full or "") or parse_year(card_text)
-
-                brand_model = None
-                if brand_model_full:
-                    # If year is the last token, strip it from brand_model.
-                    if year is not None:
-                        brand_model = re.sub(rf"\s*\b{year}\b\s*$", "", brand_model_full).strip() or brand_model_full
-                    else:
-                        brand_model = brand_model_full
-
-                # Start bid: <p id="valor_atual_lote_<id>">R$ 400,00</p>
-                start_bid = None
-                if lot_id:
-                    bid_el = card.select_one(f"#valor_atual_lote_{lot_id}")
-                    if bid_el:
-                        start_bid = safe_float(norm_text(bid_el.get_text(" ")))
-                if start_bid is None:
-                    m2 = re.search(r"R\$\s*[0-9\.,]+", card_text)
-                    if m2:
-                        start_bid = safe_float(m2.group(0))
-
-                # Images
-                imgs: list[str] = []
-                for img in card.select("img"):
-                    src = (img.get("src") or "").strip()
-                    if not src:
-                        continue
-                    imgs.append(urllib.parse.urljoin(base, src))
-
-                # Determine lot details URL from onclick (preferred)
-                lot_url = None
-                onclick = None
-                clickable = card.select_one("span[onclick]")
-                if clickable:
-                    onclick = clickable.get("onclick")
-                if onclick:
-                    m = re.search(r"/lotes/detalhes/\d+", onclick)
-                    if m:
-                        lot_url = urllib.parse.urljoin(base, m.group(0))
-
-                # Requires login: explicit button/link
-                requires_login = False
-                for a in card.select("a"):
-                    label = norm_text(a.get_text(" ")).lower()
-                    href = (a.get("href") or "").lower()
-                    if "login obrigat" in label or "/ssc/login/login" in href:
-                        requires_login = True
-                        break
-
-                # Fallback lot id using "Lote N" if card id missing
-                if not lot_id and m_lote_num:
-                    lot_id = m_lote_num.group(1)
-                if not lot_id:
-                    lot_id = re.sub(r"\W+", "-", (header_text or card_text)[:60]).strip("-").lower() or "unknown"
-
-                description_short = header_text or (f"Lote {m_lote_num.group(1)}" if m_lote_num else None) or card_text
-
-                lots.append(
-                    Lot(
-                        auction_id=auction_id,
-                        lot_id=str(lot_id),
-                        description_short=description_short[:180],
-                        brand_model=brand_model,
-                        year=year,
-                        situation=situation,
-                        start_bid=start_bid,
-                        ends_at=None,
-                        lot_url=lot_url,
-                        image_urls=tuple(imgs),
-                        requires_login=requires_login,
-                        raw_text=card_text,
-                    )
-                )
-
-            uniq: dict[str, Lot] = {l.lot_id: l for l in lots}
-            return list(uniq.values())
-
-        # Fallback: heuristic scanning if the expected structure isn't found.
-        cards = soup.select("div, article")
-        for card in cards:
-            text = norm_text(card.get_text(" "))
-            if not text or "lote" not in text.lower():
-                continue
+        m = _LOTE_ID_FALLBACK_RE.search(text)
+        lot_id = m.group(1) if m else None
+        if not lot_id:
+            lot_id = _NON_WORD.sub("-", text[:60]).strip("-").lower() or "unknown"
 
-            requires_login = "login" in text.lower() and "obrig" in text.lower()
+        year = parse_year(text)
 
-            m = re.search(r"\bLote\s*[:#-]?\s*([0-9]+[a-zA-Z0-9\-\.]*)\b", text, re.IGNORECASE)
-            lot_id = m.group(1) if m else None
-            if not lot_id:
-                lot_id = re.sub(r"\W+", "-", text[:60]).strip("-").lower() or "unknown"
+        t_low = text.lower()
+        situation = None
+        situation = _first_keyword(_SITUATION_RE, t_low)
 
-            year = parse_year(text)
+        start_bid = None
+        m2 = _MONEY_RE.search(text)
+        if m2:
+            start_bid = safe_float(m2.group(0))
 
-            t_low = text.lower()
-            situation = None
-            for k in ["sem reserva", "com reserva", "sucata", "recuper[áa]vel", "circula", "n[aã]o circula"]:
-                if re.search(k, t_low, re.IGNORECASE):
-                    situation = k
-                    break
+        ends_at = None
+        m_end = _END_RE.search(text)
+        if m_end:
+            ends_at = parse_datetime_loose(m_end.group(2))
 
-            start_bid = None
-            m2 = re.search(r"R\$\s*[0-9\.,]+", text)
-            if m2:
-                start_bid = safe_float(m2.group(0))
+        brand_model = None
+        lines = [norm_text(x) for x in _text(card, "\n").split("\n")]
+        lines = [x for x in lines if x]
+        for ln in lines[:6]:
+            if _LOTE_WORD_RE.search(ln):
+                continue
+            if _MONEY_RE.search(ln):
+                continue
+            if _ENCERR_RE.search(ln):
+                continue
+            if len(ln) >= 3:
+                brand_model = ln
+                break
 
-            ends_at = None
-            m_end = re.search(r"\b(encerramento|encerra)\b\s*[:\-]?\s*(.+)$", text, re.IGNORECASE)
-            if m_end:
-                ends_at = parse_datetime_loose(m_end.group(2))
-
-            brand_model = None
-            lines = [norm_text(x) for x in card.get_text("\n").split("\n")]
-            lines = [x for x in lines if x]
-            for ln in lines[:6]:
-                if re.search(r"\blote\b", ln, re.IGNORECASE):
-                    continue
-                if re.search(r"R\$\s*[0-9\.,]+", ln):
-                    continue
-                if re.search(r"encerr", ln, re.IGNORECASE):
-                    continue
-                if len(ln) >= 3:
-                    brand_model = ln
-                    break
-
-            imgs = [urllib.parse.urljoin(base, img.get("src")) for img in card.select("img") if img.get("src")]
-
-            link = None
-            for a in card.select("a"):
-                href = a.get("href")
-                if href and ("lote" in href.lower() or "detal" in a.get_text(" ").lower()):
-                    link = urllib.parse.urljoin(base, href)
-                    break
-
-            lots.append(
-                Lot(
-                    auction_id=auction_id,
-                    lot_id=str(lot_id),
-                    description_short=text[:180] if len(text) > 0 else "(sem descrição)",
-                    brand_model=brand_model,
-                    year=year,
-                    situation=situation,
-                    start_bid=start_bid,
-                    ends_at=ends_at,
-                    lot_url=link,
-                    image_urls=tuple(imgs),
-                    requires_login=requires_login,
-                    raw_text=text,
-                )
+        imgs = [join(img.get("src")) for img in _SEL_IMG(card) if img.get("src")]
+
+        link = None
+        for a in _SEL_A(card):
+            href = a.get("href")
+            if href and ("lote" in href.lower() or "detal" in txt(a).lower()):
+                link = join(href)
+                break
+
+        lots.append(
+            Lot(
+                auction_id=auction_id,
+                lot_id=str(lot_id),
+                description_short=text[:180] if len(text) > 0 else "(sem descrição)",
+                brand_model=brand_model,
+                year=year,
+                situation=situation,
+                start_bid=start_bid,
+                ends_at=ends_at,
+                lot_url=link,
+                image_urls=tuple(imgs),
+                requires_login=requires_login,
+                raw_text=text,
             )
+        )
 
-        uniq: dict[str, Lot] = {}
-        for l in lots:
-            uniq[l.lot_id] = l
-        return list(uniq.values())
+    return list({l.lot_id: l for l in lots}.values())
@@ -1,27 +1,52 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
-from dataclasses import dataclass
+
+# Deficits below this are not worth a sleep syscall / event-loop round trip.
+_MIN_SLEEP = 5e-4
 
 
-@dataclass
 class RateLimiter:
     """Simple interval-based rate limiter.
 
     rate_per_sec: 0.5 means at most one request every 2 seconds.
     """
 
-    rate_per_sec: float
-    _next_allowed_at: float = 0.0
+    __slots__ = ("rate_per_sec", "_interval", "_next_allowed_at", "_lock")
+
+    def __init__(self, rate_per_sec: float) -> None:
+        self.rate_per_sec = rate_per_sec
+        self._interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0.0
+        self._next_allowed_at = 0.0
+        # wait() may be called from the crawler's fallback worker threads.
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(rate_per_sec={self.rate_per_sec!r})"
+
+    def _reserve(self) -> float:
+        """Claim the next request slot and return how long to sleep before using it."""
+        interval = self._interval
+        if interval == 0.0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            next_at = self._next_allowed_at
+            if next_at < now:
+                next_at = now
+            self._next_allowed_at = next_at + interval
+        return next_at - now
 
     def wait(self) -> None:
-        if self.rate_per_sec <= 0:
-            return
-        interval = 1.0 / self.rate_per_sec
-        now = time.monotonic()
-        if self._next_allowed_at == 0.0:
-            self._next_allowed_at = now
-        sleep_for = max(0.0, self._next_allowed_at - now)
-        if sleep_for > 0:
+        sleep_for = self._reserve()
+        if sleep_for > _MIN_SLEEP:
             time.sleep(sleep_for)
-        self._next_allowed_at = max(self._next_allowed_at, now) + interval
+
+    async def wait_async(self) -> None:
+        # The slot is reserved before sleeping, so concurrent tasks queue up
+        # one interval apart instead of all waking at the same instant.
+        sleep_for = self._reserve()
+        if sleep_for > _MIN_SLEEP:
+            await asyncio.sleep(sleep_for)
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 import random
-import time
 from dataclasses import dataclass
-from typing import Callable, TypeVar
+from itertools import takewhile
+from typing import Any
 
-
-T = TypeVar("T")
+from urllib3.util.retry import Retry
 
 
 @dataclass(frozen=True)
@@ -16,18 +15,44 @@ class RetryPolicy:
     max_delay_sec: float = 8.0
     jitter: float = 0.25
 
+    # HTTP statuses worth retrying at the transport level.
+    retry_statuses: tuple[int, ...] = (429, 500, 502, 503, 504)
+
+
+class PolicyRetry(Retry):
+    """urllib3 Retry that sleeps on the RetryPolicy schedule.
+
+    Stock urllib3 backoff skips the wait before the first retry and adds jitter in
+    absolute seconds. Here failure N waits min(max_delay, base_delay * 2**(N-1)),
+    scaled by a random factor in [1 - jitter, 1 + jitter].
+    """
+
+    def __init__(self, *args: Any, policy: RetryPolicy = RetryPolicy(), **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.policy = policy
+
+    def new(self, **kw: Any) -> PolicyRetry:
+        # Retry.new() rebuilds the object from its constructor args on every attempt.
+        return super().new(policy=self.policy, **kw)
+
+    def get_backoff_time(self) -> float:
+        failures = len(list(takewhile(lambda h: h.redirect_location is None, reversed(self.history))))
+        if failures < 1:
+            return 0.0
+        p = self.policy
+        delay = min(p.max_delay_sec, p.base_delay_sec * (2 ** (failures - 1)))
+        return max(0.0, delay * (1.0 + random.uniform(-p.jitter, p.jitter)))
+
+
+def urllib3_retry(policy: RetryPolicy) -> Retry:
+    """Translate a RetryPolicy into urllib3's Retry for mounting on an HTTPAdapter.
 
-def retry_call(fn: Callable[[], T], policy: RetryPolicy, should_retry: Callable[[Exception], bool]) -> T:
-    last_exc: Exception | None = None
-    for attempt in range(1, policy.max_attempts + 1):
-        try:
-            return fn()
-        except Exception as exc:  # noqa: BLE001
-            last_exc = exc
-            if attempt >= policy.max_attempts or not should_retry(exc):
-                raise
-            delay = min(policy.max_delay_sec, policy.base_delay_sec * (2 ** (attempt - 1)))
-            delay = delay * (1.0 + random.uniform(-policy.jitter, policy.jitter))
-            time.sleep(max(0.0, delay))
-    assert last_exc is not None
-    raise last_exc
+    raise_on_status=False hands back the last response, so callers still see a
+    regular HTTPError from raise_for_status() once attempts run out.
+    """
+    return PolicyRetry(
+        total=policy.max_attempts - 1,
+        status_forcelist=policy.retry_statuses,
+        raise_on_status=False,
+        policy=policy,
+    )
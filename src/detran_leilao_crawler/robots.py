@@ -1,44 +1,110 @@
 from __future__ import annotations
 
+import functools
 import logging
+import time
 import urllib.parse
 import urllib.robotparser
 import urllib.request
+from pathlib import Path
+from typing import Optional
+
+import requests
 
 
 logger = logging.getLogger(__name__)
 
+# How long a robots.txt saved to disk is trusted before it is fetched again.
+ROBOTS_CACHE_TTL_SEC = 24 * 3600
+
+_ROBOTS_HEADERS = {"Accept": "text/plain,*/*;q=0.8"}
+
 
 class RobotsPolicy:
-    def __init__(self, base_url: str, user_agent: str = "detran-leilao-crawler") -> None:
+    def __init__(
+        self,
+        base_url: str,
+        user_agent: str = "detran-leilao-crawler",
+        session: Optional[requests.Session] = None,
+        cache_path: Optional[Path] = None,
+        cache_ttl_sec: float = ROBOTS_CACHE_TTL_SEC,
+    ) -> None:
         self.base_url = base_url
         self.user_agent = user_agent
+        # Optional keep-alive session to fetch through (saves a handshake when the
+        # crawler already talks to the same host) and on-disk copy of the rules.
+        self.session = session
+        self.cache_path = cache_path
+        self.cache_ttl_sec = cache_ttl_sec
         self._rp = urllib.robotparser.RobotFileParser()
         self._loaded = False
+        self._reset_cache()
+
+    def _reset_cache(self) -> None:
+        # Decisions are memoized per URL (pagination re-checks the same URLs);
+        # rebuilt whenever the rules change.
+        self._can_fetch_cached = functools.lru_cache(maxsize=4096)(self._can_fetch_uncached)
 
     def load(self) -> None:
         try:
             parsed = urllib.parse.urlparse(self.base_url)
             robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-            req = urllib.request.Request(
-                robots_url,
-                headers={
-                    "User-Agent": self.user_agent,
-                    "Accept": "text/plain,*/*;q=0.8",
-                },
-                method="GET",
-            )
-            with urllib.request.urlopen(req, timeout=15) as resp:  # noqa: S310
-                content = resp.read().decode("utf-8", errors="replace")
-            self._rp.parse(content.splitlines())
+            content = self._read_cache()
+            source = str(self.cache_path)
+            if content is None:
+                content = self._fetch(robots_url)
+                source = robots_url
+                self._write_cache(content)
+            rp = urllib.robotparser.RobotFileParser()
+            rp.parse(content.splitlines())
+            self._rp = rp
             self._loaded = True
-            logger.info("robots.txt loaded from %s", robots_url)
+            logger.info("robots.txt loaded from %s", source)
         except Exception as exc:  # noqa: BLE001
             # Fail-open but log it; user can enforce stricter policy if desired.
             logger.warning("robots.txt unavailable (%s). Proceeding fail-open.", exc)
             self._loaded = False
+        finally:
+            self._reset_cache()
+
+    def _fetch(self, robots_url: str) -> str:
+        if self.session is not None:
+            resp = self.session.get(
+                robots_url, headers={"User-Agent": self.user_agent, **_ROBOTS_HEADERS}, timeout=15
+            )
+            resp.raise_for_status()
+            return resp.text
+        req = urllib.request.Request(
+            robots_url,
+            headers={"User-Agent": self.user_agent, **_ROBOTS_HEADERS},
+            method="GET",
+        )
+        with urllib.request.urlopen(req, timeout=15) as resp:  # noqa: S310
+            return resp.read().decode("utf-8", errors="replace")
+
+    def _read_cache(self) -> Optional[str]:
+        if self.cache_path is None:
+            return None
+        try:
+            if time.time() - self.cache_path.stat().st_mtime >= self.cache_ttl_sec:
+                return None
+            return self.cache_path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _write_cache(self, content: str) -> None:
+        if self.cache_path is None:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(content, encoding="utf-8")
+        except OSError as exc:
+            logger.debug("Could not cache robots.txt at %s: %s", self.cache_path, exc)
 
     def can_fetch(self, url: str) -> bool:
         if not self._loaded:
             return True
+        return self._can_fetch_cached(url)
+
+    def _can_fetch_uncached(self, url: str) -> bool:
         return self._rp.can_fetch(self.user_agent, url)
@@ -16,7 +16,8 @@ def _parse_dt(value: Any) -> Optional[datetime]:
         if not s:
             return None
         try:
-            return datetime.fromisoformat(s.replace("Z", "+00:00"))
+            # Python 3.11+ fromisoformat accepts a trailing "Z" directly.
+            return datetime.fromisoformat(s)
         except Exception:  # noqa: BLE001
             return None
     return None
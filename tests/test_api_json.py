@@ -0,0 +1,15 @@
+from detran_leilao_crawler.api_json import extract_lots_from_json, find_lots_in_json
+
+
+def test_extract_lots_from_json_does_not_depend_on_earlier_payloads():
+    nested = {"data": {"content": [{"id": 1, "descricao": "Lote 1"}]}}
+    both = {"items": [{"id": 9, "descricao": "Lote 9"}], "data": {"content": [{"id": 2, "descricao": "Lote 2"}]}}
+
+    before = [l.lot_id for l in extract_lots_from_json(both, "a1")]
+    extract_lots_from_json(nested, "a1")
+    assert [l.lot_id for l in extract_lots_from_json(both, "a1")] == before == ["9"]
+
+    # An explicit key path from an earlier page of the same endpoint is probed first.
+    _, path = find_lots_in_json(nested, "a1")
+    assert path == ("data", "content")
+    assert [l.lot_id for l in find_lots_in_json(both, "a1", key_path=path)[0]] == ["2"]
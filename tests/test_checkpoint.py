@@ -11,3 +11,26 @@ def test_checkpoint_roundtrip(tmp_path):
     cp2.load()
     assert cp2.is_page_done("auction-1", 1) is True
     assert cp2.is_page_done("auction-1", 2) is False
+
+
+def test_checkpoint_roundtrip_many_pages(tmp_path):
+    p = tmp_path / "state.json"
+    cp = CrawlCheckpoint(path=p)
+    pages = set(range(1, 300)) - {7, 150}
+    for n in pages:
+        cp.mark_page_done("auction-1", n)
+    cp.save()
+
+    cp2 = CrawlCheckpoint(path=p)
+    cp2.load()
+    assert cp2.pages_done == {"auction-1": pages}
+
+
+def test_checkpoint_loads_legacy_page_lists(tmp_path):
+    p = tmp_path / "state.json"
+    p.write_text('{"pages_done": {"auction-1": [1, 2, 5]}}', encoding="utf-8")
+
+    cp = CrawlCheckpoint(path=p)
+    cp.load()
+    assert cp.pages_done == {"auction-1": {1, 2, 5}}
+
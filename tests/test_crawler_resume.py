@@ -0,0 +1,80 @@
+import asyncio
+
+import orjson
+
+from detran_leilao_crawler.crawler import DetranLeilaoCrawler
+from detran_leilao_crawler.models import Auction, Lot
+
+
+def _written_rows(out_jsonl):
+    return [orjson.loads(line)["lot"] for line in out_jsonl.read_bytes().splitlines()]
+
+
+def _crawler(tmp_path):
+    crawler = DetranLeilaoCrawler(tmp_path, headless=True, rate_limit_per_sec=0)
+    crawler.checkpoint.load()
+    return crawler
+
+
+def test_resumed_crawler_skips_unchanged_lots(tmp_path):
+    out_jsonl = tmp_path / "raw" / "auction-1" / "lots.jsonl"
+    l1 = Lot(auction_id="auction-1", lot_id="L1", description_short="Lote 1")
+
+    first = _crawler(tmp_path)
+    first._append_lots(out_jsonl, "auction-1", 1, [l1])
+    first.checkpoint.mark_page_done("auction-1", 1)
+    first.checkpoint.save()
+    first.close()
+
+    resumed = _crawler(tmp_path)
+    resumed._append_lots(
+        out_jsonl, "auction-1", 2, [l1, Lot(auction_id="auction-1", lot_id="L2", description_short="Lote 2")]
+    )
+    assert [l.lot_id for l in resumed._written_lots(out_jsonl, "auction-1").values()] == ["L1", "L2"]
+    resumed.close()
+
+    assert [row["lot_id"] for row in _written_rows(out_jsonl)] == ["L1", "L2"]
+
+
+def test_changed_lot_is_appended_again_and_wins(tmp_path):
+    out_jsonl = tmp_path / "raw" / "auction-1" / "lots.jsonl"
+    crawler = _crawler(tmp_path)
+    crawler._append_lots(out_jsonl, "auction-1", 1, [Lot(auction_id="auction-1", lot_id="L1", description_short="Lote 1", start_bid=100.0)])
+    crawler._append_lots(out_jsonl, "auction-1", 2, [Lot(auction_id="auction-1", lot_id="L1", description_short="Lote 1", start_bid=150.0)])
+    crawler.close()
+
+    assert [row["start_bid"] for row in _written_rows(out_jsonl)] == [100.0, 150.0]
+    assert crawler._load_existing_lots(out_jsonl)["L1"].start_bid == 150.0
+
+
+def test_fresh_crawl_does_not_read_existing_jsonl(tmp_path, monkeypatch):
+    out_jsonl = tmp_path / "raw" / "auction-1" / "lots.jsonl"
+    out_jsonl.parent.mkdir(parents=True)
+    out_jsonl.write_bytes(b"not json\n")
+
+    crawler = _crawler(tmp_path)
+
+    def fail(_path):
+        raise AssertionError("fresh crawl parsed lots.jsonl")
+
+    monkeypatch.setattr(crawler, "_load_existing_lots", fail)
+    crawler._append_lots(out_jsonl, "auction-1", 1, [Lot(auction_id="auction-1", lot_id="L1", description_short="Lote 1")])
+    crawler.close()
+
+
+def test_written_lots_are_released_when_the_auction_finishes(tmp_path, monkeypatch):
+    crawler = _crawler(tmp_path)
+    auction = Auction(auction_id="auction-1", url="https://leilao.detran.mg.gov.br/lotes/leilao/1")
+    lots = [Lot(auction_id="auction-1", lot_id="L1", description_short="Lote 1")]
+
+    async def crawl(auction, out_jsonl, max_pages, dry_run):
+        crawler._append_lots(out_jsonl, auction.auction_id, 1, lots)
+        assert "auction-1" in crawler._lots_written
+        return lots
+
+    monkeypatch.setattr(crawler, "_respect", lambda url: True)
+    monkeypatch.setattr(crawler, "_crawl_auction_lots_playwright", crawl)
+    assert asyncio.run(crawler._crawl_auction_lots_async(auction, max_pages=None, dry_run=False)) == lots
+    crawler.close()
+
+    assert crawler._lots_written == {}
@@ -0,0 +1,26 @@
+import asyncio
+
+from detran_leilao_crawler.crawler import _CONTENT_WAIT_SEC, DetranLeilaoCrawler
+from detran_leilao_crawler.parsers import LOT_CARD_SELECTOR
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+
+class _PageWithoutCards:
+    url = "https://leilao.detran.mg.gov.br/lotes/leilao/1"
+
+    def __init__(self):
+        self.timeouts = []
+
+    async def wait_for_selector(self, selector, state, timeout):
+        self.timeouts.append(timeout)
+        raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded waiting for {selector}")
+
+
+def test_content_wait_on_page_without_cards_is_capped(tmp_path):
+    crawler = DetranLeilaoCrawler(tmp_path, headless=True, rate_limit_per_sec=0, timeout_sec=30.0)
+    page = _PageWithoutCards()
+
+    asyncio.run(crawler._wait_for_content(page, LOT_CARD_SELECTOR))
+    crawler.close()
+
+    assert page.timeouts == [int(_CONTENT_WAIT_SEC * 1000)]
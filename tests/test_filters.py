@@ -1,4 +1,4 @@
-from detran_leilao_crawler.filters import FilterEngine
+from detran_leilao_crawler.filters import FilterEngine, filter_lots
 from detran_leilao_crawler.models import Lot
 
 
@@ -14,3 +14,31 @@ def test_filter_keywords_all():
     lot_no = Lot(auction_id="a1", lot_id="l2", description_short="Honda Fit 2018", requires_login=False)
     assert engine.accept(lot_ok) is True
     assert engine.accept(lot_no) is False
+
+
+def test_filter_keywords_any():
+    engine = FilterEngine.from_dict({"descricao_keywords_any": ["civic", "corolla"]})
+    lot_ok = Lot(auction_id="a1", lot_id="l1", description_short="Toyota Corolla 2015", requires_login=False)
+    lot_no = Lot(auction_id="a1", lot_id="l2", description_short="Honda Fit 2018", requires_login=False)
+    assert engine.accept(lot_ok) is True
+    assert engine.accept(lot_no) is False
+
+
+def test_filter_lots_matches_accept():
+    engine = FilterEngine.from_dict({"ano_min": 2010, "valor_max": 20000, "descricao_keywords_any": ["gol"]})
+    lots = [
+        Lot(auction_id="a1", lot_id="l1", description_short="VW Gol", year=2012, start_bid=15000.0, requires_login=False),
+        Lot(auction_id="a1", lot_id="l2", description_short="VW Gol", year=2005, start_bid=9000.0, requires_login=False),
+        Lot(auction_id="a1", lot_id="l3", description_short="VW Gol sucata", year=2015, requires_login=False),
+        Lot(auction_id="a1", lot_id="l4", description_short="Fiat Uno", year=2015, requires_login=False),
+    ]
+    assert [l.lot_id for l in filter_lots(lots, engine)] == ["l1"]
+    assert [l.lot_id for l in lots if engine.accept(l)] == ["l1"]
+
+
+def test_filter_keywords_all_overlapping():
+    engine = FilterEngine.from_dict({"descricao_keywords_all": ["civic", "ci", "honda"]})
+    lot_ok = Lot(auction_id="a1", lot_id="l1", description_short="Honda Civic", requires_login=False)
+    lot_no = Lot(auction_id="a1", lot_id="l2", description_short="Civic", requires_login=False)
+    assert engine.accept(lot_ok) is True
+    assert engine.accept(lot_no) is False
@@ -0,0 +1,19 @@
+from detran_leilao_crawler.parsers import parse_auction_cards_from_home
+
+
+def test_home_link_without_block_ancestor_uses_whole_page():
+    html = "<html><body><p>Cidade: Belo Publicado <a href='/leilao/1'>Detalhes</a></p></body></html>"
+    (auction,) = parse_auction_cards_from_home(html, "https://leilao.detran.mg.gov.br")
+    assert auction.url == "https://leilao.detran.mg.gov.br/leilao/1"
+    assert (auction.city, auction.status) == ("Belo Publicado Detalhes", "publicado")
+
+
+def test_home_block_walk_stops_at_fourth_ancestor():
+    html = (
+        "<html><body><div>Cidade: Belo Publicado"
+        "<p>Leilão 7/2024 <span><b><i><a href='/leilao/7'>Detalhes</a></i></b></span></p>"
+        "</div></body></html>"
+    )
+    (auction,) = parse_auction_cards_from_home(html, "https://leilao.detran.mg.gov.br")
+    # The <p> four levels up is used; the enclosing <div> with the city is not.
+    assert (auction.number, auction.city, auction.status) == ("7/2024", None, None)
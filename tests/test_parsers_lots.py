@@ -1,4 +1,4 @@
-from detran_leilao_crawler.parsers import parse_lot_cards_from_html
+from detran_leilao_crawler.parsers import parse_lot_cards_from_fragments, parse_lot_cards_from_html
 
 
 def test_parse_lot_cards_extract_brand_model_year_start_bid_and_login():
@@ -31,3 +31,47 @@ def test_parse_lot_cards_extract_brand_model_year_start_bid_and_login():
     assert lot.lot_url.endswith("/lotes/detalhes/282156")
     assert len(lot.image_urls) == 1
     assert "img_282156_1.jpg" in lot.image_urls[0]
+
+
+def test_parse_lot_cards_from_fragments_matches_full_page():
+    cards = [
+        "<div class='card listaLotes' id='1001'><div class='card-body'><b><span>Lote 1</span> - <span>SUCATA</span></b>"
+        "<p id='valor_atual_lote_1001'>R$ 1.250,00</p></div></div>",
+        "<div class='card listaLotes' id='1002'><div class='card-body'><b><span>Lote 2</span> - <span>CONSERVADO</span></b>"
+        "<p id='valor_atual_lote_1002'>R$ 800,00</p></div></div>",
+    ]
+    page_html = "<html><body><header>Leilão 10</header><main>" + "".join(cards) + "</main></body></html>"
+    url = "https://leilao.detran.mg.gov.br/lotes/lista-lotes/10/2026"
+
+    from_fragments = parse_lot_cards_from_fragments(cards, auction_id="a1", page_url=url)
+    from_page = parse_lot_cards_from_html(page_html, auction_id="a1", page_url=url)
+    assert from_fragments == from_page
+    assert [l.lot_id for l in from_fragments] == ["1001", "1002"]
+    assert parse_lot_cards_from_fragments([], auction_id="a1", page_url=url) == []
+
+
+def test_parse_lot_cards_without_lots_returns_empty_list():
+    html = "<html><body><div><p>Nenhum item disponível</p></div></body></html>"
+    assert parse_lot_cards_from_html(html, auction_id="a1", page_url="https://leilao.detran.mg.gov.br/") == []
+
+
+def test_parse_lot_cards_fallback_situation_keeps_accented_label():
+    html = "<html><body><div><article>Lote 7 - VW GOL 2010 Recuperável R$ 1.000,00</article></div></body></html>"
+    lots = parse_lot_cards_from_html(html, auction_id="a1", page_url="https://leilao.detran.mg.gov.br/")
+    assert [l.situation for l in lots] == ["recuperável"]
+
+
+def test_parse_lot_cards_fallback_situation_prefers_nao_circula_over_circula():
+    html = "<html><body><div><article>Lote 8 - FIAT UNO 2001 Não circula R$ 500,00</article></div></body></html>"
+    lots = parse_lot_cards_from_html(html, auction_id="a1", page_url="https://leilao.detran.mg.gov.br/")
+    assert [l.situation for l in lots] == ["não circula"]
+
+
+def test_parse_lot_cards_drops_control_chars_from_joined_urls():
+    html = (
+        "<html><body><div><article>Lote 12 FIAT UNO 2001"
+        "<a href='/lotes/\n12'>ver</a><img src='/img/x.jpg\t'></article></div></body></html>"
+    )
+    (lot,) = parse_lot_cards_from_html(html, auction_id="a1", page_url="https://leilao.detran.mg.gov.br/leilao/1")
+    assert lot.lot_url == "https://leilao.detran.mg.gov.br/lotes/12"
+    assert lot.image_urls == ("https://leilao.detran.mg.gov.br/img/x.jpg",)
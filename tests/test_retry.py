@@ -0,0 +1,25 @@
+import pytest
+from urllib3.util.retry import RequestHistory
+
+from detran_leilao_crawler.retry import RetryPolicy, urllib3_retry
+
+
+def _after_failures(retry, n):
+    history = tuple(RequestHistory("GET", "/lotes", None, 503, None) for _ in range(n))
+    return retry.new(history=history)
+
+
+def test_urllib3_retry_follows_policy_schedule(monkeypatch):
+    monkeypatch.setattr("random.uniform", lambda a, b: 0.0)
+    retry = urllib3_retry(RetryPolicy())
+
+    assert [_after_failures(retry, n).get_backoff_time() for n in range(5)] == [0.0, 0.75, 1.5, 3.0, 6.0]
+    assert _after_failures(retry, 6).get_backoff_time() == 8.0
+
+
+def test_urllib3_retry_jitter_is_a_fraction_of_the_delay(monkeypatch):
+    monkeypatch.setattr("random.uniform", lambda a, b: b)
+    retry = urllib3_retry(RetryPolicy(jitter=0.25))
+
+    assert _after_failures(retry, 1).get_backoff_time() == pytest.approx(0.75 * 1.25)
+    assert _after_failures(retry, 2).policy == RetryPolicy(jitter=0.25)
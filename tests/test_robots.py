@@ -9,3 +9,56 @@ def test_robots_allows_by_default_when_unavailable(monkeypatch):
     rp = RobotsPolicy("https://leilao.detran.mg.gov.br/")
     rp.load()
     assert rp.can_fetch("https://leilao.detran.mg.gov.br/") is True
+
+
+def test_robots_disallow_is_applied_after_load(monkeypatch):
+    class _Resp:
+        def __init__(self, body):
+            self._body = body
+
+        def read(self):
+            return self._body
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    bodies = [b"User-agent: *\nDisallow: /privado\n", b"User-agent: *\nDisallow:\n"]
+    monkeypatch.setattr("urllib.request.urlopen", lambda *a, **k: _Resp(bodies.pop(0)))
+
+    rp = RobotsPolicy("https://leilao.detran.mg.gov.br/")
+    rp.load()
+    assert rp.can_fetch("https://leilao.detran.mg.gov.br/privado/x") is False
+    assert rp.can_fetch("https://leilao.detran.mg.gov.br/lotes") is True
+
+    # Reloading with new rules must not serve stale cached decisions.
+    rp.load()
+    assert rp.can_fetch("https://leilao.detran.mg.gov.br/privado/x") is True
+
+
+def test_robots_served_from_fresh_disk_cache(monkeypatch, tmp_path):
+    class _Resp:
+        def read(self):
+            return b"User-agent: *\nDisallow: /privado\n"
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    calls = []
+    monkeypatch.setattr("urllib.request.urlopen", lambda *a, **k: calls.append(1) or _Resp())
+    cache = tmp_path / "robots.txt"
+
+    RobotsPolicy("https://leilao.detran.mg.gov.br/", cache_path=cache).load()
+    rp = RobotsPolicy("https://leilao.detran.mg.gov.br/", cache_path=cache)
+    rp.load()
+    assert len(calls) == 1
+    assert rp.can_fetch("https://leilao.detran.mg.gov.br/privado/x") is False
+
+    # An expired copy is fetched again.
+    RobotsPolicy("https://leilao.detran.mg.gov.br/", cache_path=cache, cache_ttl_sec=0).load()
+    assert len(calls) == 2